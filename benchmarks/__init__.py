@@ -0,0 +1,5 @@
+"""
+Benchmarks, run them from the top of the repo like:
+
+    python -m benchmarks.bench_snapshot
+"""
@@ -0,0 +1,46 @@
+""" How long loading every image takes, from the PNGs and from the bundle.
+
+    python -m benchmarks.bench_bundle
+"""
+import os
+import tempfile
+import time
+
+import pygame
+
+from stuntcat import bundle
+from stuntcat.resources import data_path
+
+
+def main():
+    """
+    Print the time to load and convert_alpha every image both ways.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode((960, 540))
+    images_dir = os.path.join(data_path(), "images")
+    names = sorted(name for name in os.listdir(images_dir) if name.endswith(".png"))
+
+    start_time = time.perf_counter()
+    for name in names:
+        pygame.image.load(os.path.join(images_dir, name)).convert_alpha()
+    png_time = time.perf_counter() - start_time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, bundle.FILENAME)
+        bundle.build(images_dir, path)
+        start_time = time.perf_counter()
+        image_bundle = bundle.Bundle(path, images_dir)
+        for name in names:
+            image_bundle.image(name).convert_alpha()
+        bundle_time = time.perf_counter() - start_time
+        del image_bundle
+
+    print("%s images" % len(names))
+    print("png decode: %.1f ms" % (png_time * 1000))
+    print("bundle:     %.1f ms" % (bundle_time * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+""" How long importing the game takes, checked against a budget.
+
+    python -m benchmarks.bench_importtime [budget ms]
+
+Runs ``python -X importtime -c "import pygame, numpy; import stuntcat.game"``
+in a fresh process, and prints the slowest imports. pygame and numpy are
+imported first, so they are not counted in stuntcat.game's time: they
+take most of the time, and it is not up to stuntcat. Exits with 1 if
+what stuntcat adds is over budget.
+"""
+import os
+import subprocess
+import sys
+
+# What importing stuntcat.game adds to pygame and numpy. It is a few ms,
+# and any of pymunk, pytmx or the gif maker would take it over.
+BUDGET_MS = 15
+MODULE = "stuntcat.game"
+# Imported before MODULE, and not counted in its time.
+BASELINE = ("pygame", "numpy")
+
+
+def import_times(module=MODULE, baseline=BASELINE):
+    """
+    :param module: What to import.
+    :param baseline: Modules to import before module.
+    :return: list of (cumulative us, self us, module name), in import order.
+    """
+    code = "import %s; import %s" % (", ".join(baseline), module)
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stderr=subprocess.PIPE,
+        env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1"),
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append((int(cumulative_us), int(self_us), name.strip()))
+    return times
+
+
+def main(budget_ms=BUDGET_MS, slowest=10):
+    """
+    Print the import time of stuntcat.game and its slowest imports.
+
+    :param budget_ms: Exit with 1 if importing stuntcat.game after the
+        baseline takes longer.
+    :param slowest: How many of the slowest imports to show.
+    """
+    times = import_times()
+    cumulative = {t[2]: t[0] / 1000.0 for t in times}
+    total_ms = cumulative[MODULE]
+    # Only the imports after the baseline's, which are stuntcat.game's.
+    baseline_end = max(i for i, t in enumerate(times) if t[2] in BASELINE) + 1
+    print("%-40s %10s %10s" % ("module", "self ms", "total ms"))
+    for cumulative_us, self_us, name in sorted(
+        times[baseline_end:], key=lambda t: -t[1]
+    )[:slowest]:
+        print("%-40s %10.1f %10.1f" % (name, self_us / 1000.0, cumulative_us / 1000.0))
+    imported = {t[2] for t in times}
+    for lazy in ("pymunk", "pytmx", "stuntcat.gifmaker"):
+        print("%-40s %s" % (lazy, "imported" if lazy in imported else "not imported"))
+    for name in BASELINE:
+        if name in cumulative:
+            print("import %s: %.1f ms, not counted" % (name, cumulative[name]))
+    print("import %s: %.1f ms, budget %s ms" % (MODULE, total_ms, budget_ms))
+    if total_ms > budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:2]])
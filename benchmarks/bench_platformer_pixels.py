@@ -0,0 +1,47 @@
+""" How many pixels a frame the platformer pushes to the display.
+
+    python -m benchmarks.bench_platformer_pixels
+"""
+import os
+
+from stuntcat.game import Game
+from stuntcat.resources import data_path
+
+
+def main(frames=300):
+    """
+    Print the pixels updated a frame by PlatformerScene.render, against the
+    whole window it used to update every frame.
+
+    :param frames: How many frames to run the scene for.
+    """
+    game = Game(headless=True, render=False)
+    # The scene loads its map relative to the working directory.
+    os.chdir(os.path.dirname(data_path()))
+    from stuntcat.scenes import PlatformerScene  # pylint:disable=import-outside-toplevel
+
+    scene = PlatformerScene(game)
+    game.scenes = [scene]
+    time_delta = 1000.0 / game.FPS
+
+    pixels = []
+    for _ in range(frames):
+        scene.tick(time_delta)
+        rects = scene.render()
+        pixels.append(sum(rect.width * rect.height for rect in rects))
+    full = game.screen.get_width() * game.screen.get_height()
+    after_first = pixels[1:]
+
+    print("full window:        %s pixels/frame" % full)
+    print(
+        "dirty rects:        %.0f pixels/frame (%.1f%% of the window)"
+        % (
+            sum(after_first) / len(after_first),
+            100.0 * sum(after_first) / len(after_first) / full,
+        )
+    )
+    print("dirty rects, worst: %s pixels/frame" % max(after_first))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+""" Time Cat.update rotating the frame every time against the rotation cache.
+
+Then play a session of the cat scene, and print how often the cache hits.
+
+    python -m benchmarks.bench_rotation
+"""
+import math
+import random
+import timeit
+
+import pygame
+
+from stuntcat.game import Game
+from stuntcat.resources import RotationCache
+from stuntcat.scenes.unisharklazer import cat
+
+
+def _uncached(image, angle):
+    """What Cat.update did before the cache, rotate every change."""
+    return pygame.transform.rotate(image, angle)
+
+
+def _time_updates(scene, frames):
+    """
+    :return: Seconds for Cat.update over frames leaning angles.
+    """
+    angles = [
+        math.sin(i / 20.0) * 1.2 + random.uniform(-0.01, 0.01) for i in range(frames)
+    ]
+    sprite = scene.cat
+
+    def run():
+        for angle in angles:
+            scene.player_data.cat_angle = angle
+            sprite.update()
+
+    return timeit.timeit(run, number=1)
+
+
+def _press(scene, key_type, key):
+    scene.event(pygame.event.Event(key_type, key=key))
+
+
+def _play_session(scene, frames):
+    """
+    Play the scene like a player would, for frames at 30 fps.
+
+    The cat is tilted back when it leans too far, rides left and right
+    for a few seconds at a time, and jumps every so often.
+    """
+    held = None
+    for frame in range(frames):
+        angle = scene.player_data.cat_angle
+        if frame % 6 == 0 and abs(angle) > 0.15:
+            key = pygame.K_a if angle > 0 else pygame.K_d
+            _press(scene, pygame.KEYDOWN, key)
+            _press(scene, pygame.KEYUP, key)
+        if frame % 90 == 0:
+            if held is not None:
+                _press(scene, pygame.KEYUP, held)
+            held = random.choice([pygame.K_LEFT, pygame.K_RIGHT, None, None])
+            if held is not None:
+                _press(scene, pygame.KEYDOWN, held)
+        if frame % 200 == 0:
+            _press(scene, pygame.KEYDOWN, pygame.K_UP)
+        elif frame % 200 == 20:
+            _press(scene, pygame.KEYUP, pygame.K_UP)
+        scene.tick(1000.0 / 30)
+
+
+def main(frames=3000, session_frames=54000):
+    """
+    Print how long a cat update takes with and without the rotation cache,
+    and the cache hit rate over a session.
+
+    :param frames: How many updates to time.
+    :param session_frames: How long the session is, 30 minutes by default.
+    """
+    random.seed(1)
+    game = Game(headless=True, render=False)
+    scene = game.cat_scene
+
+    cached_rotate = cat.ROTATIONS.get
+    try:
+        cat.ROTATIONS.get = _uncached
+        uncached = _time_updates(scene, frames)
+    finally:
+        cat.ROTATIONS.get = cached_rotate
+    cat.ROTATIONS.clear()
+    cold = _time_updates(scene, frames)
+    warm = _time_updates(scene, frames)
+
+    print("rotate every update: %.1f us/frame" % (1e6 * uncached / frames))
+    print("cache, cold:         %.1f us/frame" % (1e6 * cold / frames))
+    print("cache, warm:         %.1f us/frame" % (1e6 * warm / frames))
+    print("cached rotations:    %s" % len(cat.ROTATIONS))
+
+    # A fresh cache the same size, so the counts are the session's own.
+    cat.ROTATIONS = RotationCache(max_bytes=cat.ROTATIONS.stats()["max_bytes"])
+    _play_session(scene, session_frames)
+    stats = cat.ROTATIONS.stats()
+    print("session deaths:      %s" % scene.deaths)
+    print(
+        "session hit rate:    %.1f%% (%s hits, %s misses, %s evictions)"
+        % (
+            100.0 * stats["hits"] / (stats["hits"] + stats["misses"]),
+            stats["hits"],
+            stats["misses"],
+            stats["evictions"],
+        )
+    )
+    print(
+        "session cache:       %.1f of %.1f MB"
+        % (stats["resident_bytes"] / 2 ** 20, stats["max_bytes"] / 2 ** 20)
+    )
+
+
+if __name__ == "__main__":
+    main()
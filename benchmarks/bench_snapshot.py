@@ -0,0 +1,40 @@
+""" How many CatUniScene snapshots and restores can be done a second.
+
+    python -m benchmarks.bench_snapshot
+"""
+import pickle
+import random
+import timeit
+
+from stuntcat.game import Game
+
+
+def main(number=20000):
+    """
+    Print snapshots/sec and restores/sec for a scene in the middle of a game.
+
+    :param number: How many of each to time.
+    """
+    random.seed(1)
+    game = Game(headless=True, render=False)
+    scene = game.cat_scene
+    scene.player_data._score = 60  # pylint:disable=protected-access
+    game.simulate(30)
+    snapshot = scene.snapshot()
+
+    snapshot_time = timeit.timeit(scene.snapshot, number=number)
+    restore_time = timeit.timeit(lambda: scene.restore(snapshot), number=number)
+    print("flying objects: %s" % (len(scene.fish) + len(scene.not_fish)))
+    print("snapshot size:  %s bytes pickled" % len(pickle.dumps(snapshot)))
+    print(
+        "snapshots/sec:  %.0f (%.1f us each)"
+        % (number / snapshot_time, 1e6 * snapshot_time / number)
+    )
+    print(
+        "restores/sec:   %.0f (%.1f us each)"
+        % (number / restore_time, 1e6 * restore_time / number)
+    )
+
+
+if __name__ == "__main__":
+    main()
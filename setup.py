@@ -42,7 +42,7 @@ if any(x in sys.argv for x in freeze_cmds):
     # Dependencies are automatically detected, but it might need fine tuning.
     build_exe_options = {
         "packages": [
-            "os", "pygame", "sys", "typing", "random", "pyscroll", "pytmx", "thorpy", "pymunk"
+            "os", "pygame", "sys", "typing", "random", "pyscroll", "pytmx", "thorpy", "pymunk", "numpy"
         ],
         "excludes": ["tkinter"],
     }
@@ -99,11 +99,12 @@ setup(
     # package_data={'stuntcat': []},
     url='https://github.com/pygame/stuntcat',
     install_requires=[
-        "pygame",
+        "pygame>=2.1.3",
         "pyscroll",
         "pytmx",
         "thorpy",
         "pymunk>=5.4.2",
+        "numpy",
     ],
     version=__version__,
     extras_require={
@@ -0,0 +1,159 @@
+""" All the images decoded ahead of time into one file, to load by mmap.
+
+Decoding every PNG is a good part of starting the game. A bundle holds
+the pixels of every image already decoded, in the BGRA byte order the
+display uses, so a surface is made straight from the mapped file.
+
+Build it after changing any images with::
+
+    python -m stuntcat.bundle
+
+The file is: a header, a JSON index of name to where its pixels are,
+then the pixels of each image, 64 byte aligned.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import pygame
+
+MAGIC = b"SCBN"
+VERSION = 2
+ALIGN = 64
+# How the pixels are stored, and read back by pygame.image.frombuffer.
+PIXEL_FORMAT = "BGRA"
+
+# magic, version, index length
+HEADER = struct.Struct("<4sHI")
+
+FILENAME = "images.bundle"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".bmp", ".gif")
+
+
+def _source_stamp(path):
+    """
+    :return: What the bundle checks to know a source image is unchanged.
+
+    The size and a CRC of the file's bytes, as file times are not kept
+    by sdists, wheels or frozen builds.
+    """
+    with open(path, "rb") as afile:
+        data = afile.read()
+    return [len(data), zlib.crc32(data)]
+
+
+def build(images_dir, path):
+    """
+    Decode every image in images_dir and pack them into a bundle file.
+
+    :param images_dir: Directory of the source images.
+    :param path: Where to write the bundle.
+    :return: The number of images packed.
+    """
+    names = sorted(
+        name for name in os.listdir(images_dir) if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    index = {}
+    pixels = []
+    offset = 0
+    for name in names:
+        source = os.path.join(images_dir, name)
+        surface = pygame.image.load(source)
+        data = pygame.image.tobytes(surface, PIXEL_FORMAT)
+        index[name] = [
+            offset,
+            surface.get_width(),
+            surface.get_height(),
+            _source_stamp(source),
+        ]
+        pixels.append(data)
+        offset += len(data) + (-len(data)) % ALIGN
+
+    index_data = json.dumps(index, sort_keys=True).encode("utf-8")
+    data_start = HEADER.size + len(index_data)
+    data_start += (-data_start) % ALIGN
+    with open(path, "wb") as afile:
+        afile.write(HEADER.pack(MAGIC, VERSION, len(index_data)))
+        afile.write(index_data)
+        afile.write(b"\0" * (data_start - HEADER.size - len(index_data)))
+        for data in pixels:
+            afile.write(data)
+            afile.write(b"\0" * ((-len(data)) % ALIGN))
+    return len(names)
+
+
+class Bundle:
+    """
+    A memory mapped bundle file.
+    """
+
+    def __init__(self, path, images_dir=None):
+        """
+        :param path: The bundle file.
+        :param images_dir: If given, images changed since the bundle was
+            built there are left out, so they get loaded from their file.
+        :raises ValueError: If the file is not a bundle of this version.
+        """
+        self.path = path
+        with open(path, "rb") as afile:
+            # A private mapping is writable, as frombuffer needs, but only
+            # pages that get written to are copied.
+            self._map = mmap.mmap(afile.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_length = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError("%s is not a version %s image bundle" % (path, VERSION))
+        self.index = json.loads(
+            bytes(self._map[HEADER.size : HEADER.size + index_length]).decode("utf-8")
+        )
+        data_start = HEADER.size + index_length
+        self._data_start = data_start + (-data_start) % ALIGN
+        if images_dir is not None:
+            self.index = {
+                name: entry
+                for name, entry in self.index.items()
+                if os.path.exists(os.path.join(images_dir, name))
+                and _source_stamp(os.path.join(images_dir, name)) == entry[3]
+            }
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def image(self, name):
+        """
+        :param name: Image file name, as in the images directory.
+        :return: A surface using the mapped pixels, not a copy of them.
+        """
+        offset, width, height, _ = self.index[name]
+        start = self._data_start + offset
+        view = memoryview(self._map)[start : start + width * height * 4]
+        return pygame.image.frombuffer(view, (width, height), PIXEL_FORMAT)
+
+
+def load(images_dir):
+    """
+    :param images_dir: Directory of the source images.
+    :return: The Bundle next to images_dir, or None if there isn't a usable one.
+    """
+    path = os.path.join(os.path.dirname(images_dir), FILENAME)
+    try:
+        return Bundle(path, images_dir)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    """
+    Build the bundle for the game's images.
+    """
+    data_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+    images_dir = os.path.join(data_dir, "images")
+    path = os.path.join(data_dir, FILENAME)
+    count = build(images_dir, path)
+    print("Packed %s images into %s" % (count, path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+""" Gym style environments for training bots on the cat unicycle scene.
+
+::Example::
+
+    >>> from stuntcat.env import VecEnv
+    >>> envs = VecEnv(16)
+    >>> observations = envs.reset()
+    >>> observations, rewards, dones = envs.step([ACTION_RIGHT] * 16)
+
+All the scenes share one headless Game, screen and the resources caches,
+so making more environments does not load any images or sounds again.
+"""
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+import pygame
+
+from stuntcat.game import Game
+from stuntcat.scenes import CatUniScene
+
+
+ACTION_NOOP = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_TILT_LEFT = 3
+ACTION_TILT_RIGHT = 4
+ACTION_JUMP = 5
+NUM_ACTIONS = 6
+
+# Keys held down for each action. Tilting happens on key down, so tilt
+# keys are pressed and released again in the same step.
+ACTION_KEYS = {
+    ACTION_NOOP: (),
+    ACTION_LEFT: (pygame.K_LEFT,),
+    ACTION_RIGHT: (pygame.K_RIGHT,),
+    ACTION_TILT_LEFT: (pygame.K_a,),
+    ACTION_TILT_RIGHT: (pygame.K_d,),
+    ACTION_JUMP: (pygame.K_UP,),
+}
+TAP_KEYS = (pygame.K_a, pygame.K_d)
+
+OBSERVATION_SIZE = 14
+DEATH_REWARD = -1.0
+
+
+def observe(scene, out):
+    """
+    Write the observation for a scene into out.
+
+    :param scene: a CatUniScene.
+    :param out: float array of OBSERVATION_SIZE to write into.
+    """
+    player_data = scene.player_data
+    head_x, head_y = player_data.cat_head_location
+    out[0:2] = player_data.cat_location
+    out[2:4] = player_data.cat_speed
+    out[4] = player_data.cat_angle
+    out[5] = player_data.cat_angular_vel
+    out[6] = head_x
+    out[7] = head_y
+    out[8:10] = _nearest(scene.fish, head_x, head_y)
+    out[10:12] = _nearest(scene.not_fish, head_x, head_y)
+    out[12] = scene.shark.state
+    out[13] = scene.jumping
+
+
+def _nearest(group, head_x, head_y):
+    """
+    Offset from the cat head to the nearest sprite in group.
+
+    :return: (dx, dy), or (0, 0) if the group is empty.
+    """
+    nearest = (0.0, 0.0)
+    nearest_dist = math.inf
+    for sprite in group:
+        offset_x = sprite.pos[0] - head_x
+        offset_y = sprite.pos[1] - head_y
+        dist = offset_x * offset_x + offset_y * offset_y
+        if dist < nearest_dist:
+            nearest_dist = dist
+            nearest = (offset_x, offset_y)
+    return nearest
+
+
+class VecEnv:
+    """
+    N independent cat unicycle scenes stepped together.
+
+    Observations, rewards and dones are returned as stacked numpy arrays.
+    The arrays are reused between calls, so copy them to keep them.
+    A cat dying ends its episode, and the environment is reset for the
+    next one, so the observation step returns for it is the first of the
+    new episode.
+
+    The scenes are made once, on the first reset, and later resets restore
+    them to a snapshot taken then. Scenes are not cheap to make, and each
+    plays its unicycle sound for as long as it lives.
+    """
+
+    def __init__(self, num_envs, game=None, time_delta=None):
+        """
+        :param num_envs: How many scenes to run.
+        :param game: Game to attach the scenes to, a headless one by default.
+        :param time_delta: ms per step, defaults to 1000 / Game.FPS.
+        """
+        if game is None:
+            game = Game(headless=True, render=False)
+        self.game = game
+        self.num_envs = num_envs
+        self.time_delta = 1000.0 / Game.FPS if time_delta is None else time_delta
+
+        self.scenes = []
+        # CatUniScene.snapshot of each scene when it was made.
+        self.initial_snapshots = []
+        self.held_keys = []
+        self.last_scores = np.zeros(num_envs, dtype=np.int64)
+        self.last_deaths = np.zeros(num_envs, dtype=np.int64)
+
+        self.observations = np.zeros((num_envs, OBSERVATION_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+
+    def reset(self):
+        """
+        Start every environment from the beginning of an episode.
+
+        :return: The observations.
+        """
+        if not self.scenes:
+            self.scenes = [CatUniScene(self.game) for _ in range(self.num_envs)]
+            self.initial_snapshots = [scene.snapshot() for scene in self.scenes]
+            self.held_keys = [set() for _ in range(self.num_envs)]
+        for idx in range(self.num_envs):
+            self._reset_env(idx)
+        return self.observations
+
+    def _reset_env(self, idx):
+        """
+        Put one scene back how it was made, and observe it.
+
+        The random numbers carry on rather than being restored too, so
+        episodes are not all the same.
+        """
+        scene = self.scenes[idx]
+        random_state = random.getstate()
+        scene.restore(self.initial_snapshots[idx])
+        random.setstate(random_state)
+        self.held_keys[idx].clear()
+        self.last_scores[idx] = scene.player_data.score
+        self.last_deaths[idx] = scene.deaths
+        observe(scene, self.observations[idx])
+
+    def step(self, actions):
+        """
+        Apply one action per environment and advance them all one frame.
+
+        :param actions: sequence of num_envs ACTION_* values.
+        :return: (observations, rewards, dones)
+        """
+        time_delta = self.time_delta
+        for idx, scene in enumerate(self.scenes):
+            self._apply_action(idx, scene, actions[idx])
+            scene.tick(time_delta)
+
+            died = scene.deaths != self.last_deaths[idx]
+            self.dones[idx] = died
+            if died:
+                self.rewards[idx] = DEATH_REWARD
+                self._reset_env(idx)
+            else:
+                score = scene.player_data.score
+                self.rewards[idx] = score - self.last_scores[idx]
+                self.last_scores[idx] = score
+                observe(scene, self.observations[idx])
+        return self.observations, self.rewards, self.dones
+
+    def _apply_action(self, idx, scene, action):
+        """
+        Send the key events that turn the held keys into those of action.
+        """
+        held = self.held_keys[idx]
+        wanted = ACTION_KEYS[int(action)]
+        for key in [key for key in held if key not in wanted]:
+            held.discard(key)
+            scene.event(pygame.event.Event(pygame.KEYUP, key=key))
+        for key in wanted:
+            if key not in held:
+                scene.event(pygame.event.Event(pygame.KEYDOWN, key=key))
+                if key in TAP_KEYS:
+                    scene.event(pygame.event.Event(pygame.KEYUP, key=key))
+                else:
+                    held.add(key)
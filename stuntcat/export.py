@@ -0,0 +1,210 @@
+""" Export a recorded session to a gif or mp4, rendering on every core.
+
+The log is simulated once headless without rendering, which is quick,
+taking a scene snapshot at the start of every chunk of frames. Worker
+processes each restore a snapshot, then render and encode their chunk.
+The chunks are joined at the end: gif bodies share a palette so they
+are concatenated, and mp4 chunks go through ffmpeg's concat demuxer.
+
+::Example::
+
+    python -m stuntcat.export session.rec highlights.gif
+"""
+import os
+import pickle
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# How many seconds of frames each worker renders at a time.
+CHUNK_SECONDS = 5
+FORMATS = (".gif", ".mp4")
+
+
+def plan_chunks(replayer, chunk_frames):
+    """
+    Simulate the log, snapshotting the scene at every chunk start.
+
+    :param replayer: A stuntcat.replay.Replayer of the log.
+    :param chunk_frames: Frames in a chunk.
+    :return: list of (first frame, frame count, pickled snapshot).
+    """
+    # pylint:disable=import-outside-toplevel
+    from stuntcat.game import Game
+
+    random.seed(replayer.seed)
+    game = Game(headless=True, render=False)
+    chunks = []
+    frame_count = 0
+    for time_delta, events in replayer.frames():
+        if frame_count % chunk_frames == 0:
+            snapshot = pickle.dumps(game.cat_scene.snapshot())
+            chunks.append([frame_count, 0, snapshot])
+        game.tick(time_delta)
+        game.events(events)
+        chunks[-1][1] += 1
+        frame_count += 1
+    return [tuple(chunk) for chunk in chunks]
+
+
+def _render_frames(replay_path, first_frame, frame_count, snapshot):
+    """
+    Restore snapshot and play its chunk of the log, rendering every frame.
+
+    :return: A generator of the RGB bytes of each frame.
+    """
+    # pylint:disable=import-outside-toplevel
+    import itertools
+
+    import pygame
+
+    from stuntcat.game import Game
+    from stuntcat.replay import Replayer
+
+    game = Game(headless=True)
+    scene = game.cat_scene
+    scene.restore(pickle.loads(snapshot))
+    # Draw everything on the first frame, not only what changed.
+    scene.screen.blit(scene.background, (0, 0))
+    scene.allsprites.repaint_rect(scene.screen.get_rect())
+
+    frames = itertools.islice(
+        Replayer(replay_path).frames(), first_frame, first_frame + frame_count
+    )
+    for time_delta, events in frames:
+        game.tick(time_delta)
+        game.render()
+        game.events(events)
+        yield pygame.image.tobytes(game.screen, "RGB")
+
+
+def _export_chunk(job):  # pylint:disable=too-many-locals
+    """
+    Render and encode one chunk, in a worker process.
+
+    :param job: (replay path, chunk path, fps, first frame, frame count, snapshot)
+    :return: The chunk path.
+    """
+    replay_path, chunk_path, fps, first_frame, frame_count, snapshot = job
+    # pylint:disable=import-outside-toplevel
+    from stuntcat.game import Game
+    from stuntcat.gifencoder import GifEncoder
+    from stuntcat.gifmaker import FfmpegPipe, which
+
+    frames = _render_frames(replay_path, first_frame, frame_count, snapshot)
+    size = (Game.WIDTH, Game.HEIGHT)
+    if chunk_path.endswith(".gif"):
+        with GifEncoder(
+            chunk_path, size, fps, first_frame=first_frame, body_only=True
+        ) as encoder:
+            for frame in frames:
+                encoder.add_frame(frame)
+    else:
+        pipe = FfmpegPipe(
+            which("ffmpeg"),
+            size,
+            fps,
+            chunk_path,
+            ["-loglevel", "error", "-c:v", "libx264", "-pix_fmt", "yuv420p"],
+        )
+        for frame in frames:
+            pipe.write(frame)
+        if not pipe.close():
+            raise ValueError("ffmpeg could not make %s" % chunk_path)
+    return chunk_path
+
+
+def _join_gif(chunk_paths, output_path):
+    # pylint:disable=import-outside-toplevel
+    from stuntcat.game import Game
+    from stuntcat.gifencoder import TRAILER, header
+
+    with open(output_path, "wb") as output:
+        output.write(header((Game.WIDTH, Game.HEIGHT)))
+        for chunk_path in chunk_paths:
+            with open(chunk_path, "rb") as chunk:
+                shutil.copyfileobj(chunk, output)
+        output.write(TRAILER)
+
+
+def _join_mp4(chunk_paths, output_path, ffmpeg_path):
+    list_path = os.path.join(os.path.dirname(chunk_paths[0]), "chunks.txt")
+    with open(list_path, "w", encoding="utf-8") as list_file:
+        for chunk_path in chunk_paths:
+            list_file.write("file '%s'\n" % chunk_path)
+    # The chunks are already encoded the same way, so they're just copied.
+    cmd = [ffmpeg_path, "-loglevel", "error", "-f", "concat", "-safe", "0"]
+    cmd += ["-i", list_path, "-c", "copy", "-y", output_path]
+    if subprocess.call(cmd) != 0:
+        raise ValueError("ffmpeg could not join the chunks into %s" % output_path)
+
+
+def export(replay_path, output_path, num_workers=None, chunk_seconds=CHUNK_SECONDS):
+    """
+    Render a recorded session to a gif or mp4 file.
+
+    :param replay_path: A log made by stuntcat.replay.Recorder.
+    :param output_path: Ending with .gif, or .mp4 which needs ffmpeg.
+    :param num_workers: Worker processes, one per core by default.
+    :param chunk_seconds: Seconds of frames each worker renders at a time.
+    :return: The number of frames exported.
+    """
+    # pylint:disable=import-outside-toplevel,too-many-locals
+    from stuntcat.gifmaker import which
+    from stuntcat.processes import worker_context
+    from stuntcat.replay import Replayer
+
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError("can only export to %s, not %s" % (FORMATS, output_path))
+    ffmpeg_path = which("ffmpeg")
+    if extension == ".mp4" and ffmpeg_path is None:
+        raise ValueError("exporting mp4 needs ffmpeg")
+
+    replayer = Replayer(replay_path)
+    chunks = plan_chunks(replayer, max(1, int(chunk_seconds * replayer.fps)))
+    if not chunks:
+        raise ValueError("%s has no frames" % replay_path)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = [
+            (
+                replay_path,
+                os.path.join(tmp_dir, "chunk_%05d%s" % (index, extension)),
+                replayer.fps,
+                first_frame,
+                frame_count,
+                snapshot,
+            )
+            for index, (first_frame, frame_count, snapshot) in enumerate(chunks)
+        ]
+        with worker_context().Pool(num_workers or os.cpu_count() or 1) as pool:
+            chunk_paths = pool.map(_export_chunk, jobs, chunksize=1)
+            # Leaving the with would terminate() the workers, but SDL turns
+            # SIGTERM into a QUIT event, so let them finish and exit.
+            pool.close()
+            pool.join()
+        if extension == ".gif":
+            _join_gif(chunk_paths, output_path)
+        else:
+            _join_mp4(chunk_paths, output_path, ffmpeg_path)
+    return sum(chunk[1] for chunk in chunks)
+
+
+def main(argv=None):
+    """
+    python -m stuntcat.export session.rec output.gif [workers]
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 2:
+        print(main.__doc__.strip())
+        sys.exit(2)
+    num_workers = int(args[2]) if len(args) > 2 else None
+    frames = export(args[0], args[1], num_workers)
+    print("exported %s frames to %s" % (frames, args[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+""" Timing of the parts of each frame, kept in fixed size ring buffers.
+
+::Example::
+
+    >>> times = FrameTimes(size=300)
+    >>> with times.time("tick"):
+    ...     game.tick(time_delta)
+    >>> print(times.report())
+"""
+import time
+from contextlib import contextmanager
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+PERCENTILES = (50, 95, 99)
+
+
+class FrameTimes:
+    """
+    The last size durations of each named part of a frame, in seconds.
+    """
+
+    def __init__(self, size=600):
+        """
+        :param size: How many frames to keep for each name.
+        """
+        self.size = size
+        self._rings = {}  # name -> numpy array of durations.
+        self._counts = {}  # name -> how many durations were ever recorded.
+
+    def record(self, name, duration):
+        """
+        Record how long a part of a frame took.
+
+        :param name: The part of the frame, like "tick" or "render CatUniScene".
+        :param duration: Seconds it took.
+        """
+        ring = self._rings.get(name)
+        if ring is None:
+            ring = self._rings[name] = np.zeros(self.size)
+            self._counts[name] = 0
+        count = self._counts[name]
+        ring[count % self.size] = duration
+        self._counts[name] = count + 1
+
+    @contextmanager
+    def time(self, name):
+        """
+        Record how long the with block takes.
+
+        :param name: The part of the frame.
+        """
+        start_time = time.perf_counter()
+        yield
+        self.record(name, time.perf_counter() - start_time)
+
+    def durations(self, name):
+        """
+        :param name: The part of the frame.
+        :return: The durations kept for name, in no particular order.
+        """
+        return self._rings[name][: min(self._counts[name], self.size)]
+
+    def summary(self):
+        """
+        :return: dict of name to its (p50, p95, p99) durations in seconds.
+        """
+        return {
+            name: tuple(np.percentile(self.durations(name), PERCENTILES))
+            for name in self._rings
+        }
+
+    def report(self):
+        """
+        :return: A table of the percentiles for every name, in ms.
+        """
+        lines = [
+            "%-28s %9s %9s %9s" % (("frame part",) + tuple("p%s ms" % p for p in PERCENTILES))
+        ]
+        for name, values in sorted(self.summary().items()):
+            lines.append(
+                "%-28s %9.3f %9.3f %9.3f" % ((name,) + tuple(v * 1000 for v in values))
+            )
+        return "\n".join(lines)
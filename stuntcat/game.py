@@ -1,6 +1,7 @@
 """
 Game Module
 """
+import os
 import time
 
 from typing import List
@@ -13,11 +14,10 @@ except ImportError as exc:
     )
 
 
+from stuntcat import scenes
 from stuntcat.scenes import Scene
-from stuntcat.scenes import LoadingScene
-from stuntcat.scenes import CatUniScene
 
-from stuntcat.gifmaker import GifMaker
+from stuntcat.frametimes import FrameTimes
 
 
 class Game:
@@ -30,7 +30,28 @@ class Game:
     HEIGHT = 540
     FPS = 30
 
-    def __init__(self):
+    # How often the headless mainloop prints its steps/sec, in seconds.
+    REPORT_INTERVAL = 5
+    # How many frames of timings to keep.
+    FRAME_TIMES = 600
+
+    def __init__(self, headless=False, render=True, recorder=None, instant_replay=None):
+        """
+        :param headless: Use the dummy SDL video and audio drivers,
+            skip the loading screen and don't cap the frame rate.
+        :param render: If False, scenes are ticked but never rendered.
+        :param recorder: A stuntcat.replay.Recorder to record the session with.
+        :param instant_replay: Keep this many seconds of frames, for K_r
+            to save as a gif.
+        """
+        self.headless = headless
+        self.render_enabled = render
+        self.recorder = recorder
+        if headless:
+            # These have to be set before pygame.init() picks the drivers.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.mixer.pre_init(44100, -16, 2, 512)
         pygame.init()
         pygame.font.init()
@@ -50,20 +71,38 @@ class Game:
             pass
 
         self.running = True
+        # How long the parts of recent frames took, F3 prints them.
+        self.frame_times = FrameTimes(self.FRAME_TIMES)
 
-        self.scenes = [
-            LoadingScene(self),
-        ]  # type: List[Scene]
+        self.scenes = []  # type: List[Scene]
         self.cat_scene = None
-        # self.add_cat_scene()
-
-        self.gif_maker = GifMaker(seconds=2)
+        # While step runs, add_cat_scene waits for the next frame.
+        self._stepping = False
+        self._cat_scene_pending = False
+        # Made when K_g is first pressed, see _capture_gif.
+        self.gif_maker = None
+        if instant_replay is not None and not headless:
+            self.gif_maker = self._make_gif_maker(replay_seconds=instant_replay)
+        if headless:
+            self.add_cat_scene()
+        else:
+            self.scenes.append(scenes.LoadingScene(self))
 
     def add_cat_scene(self):
         """
         Add the cat scene.
+
+        Partway through a frame, like when the loading screen ends, the
+        scene is added at the start of the next frame. So it gets all of
+        a frame's tick and events or none of them, and a recording of it
+        starts on a frame boundary.
         """
-        self.cat_scene = CatUniScene(self)
+        if self._stepping:
+            self._cat_scene_pending = True
+            return
+        if self.recorder is not None:
+            self.recorder.start(self.FPS)
+        self.cat_scene = scenes.CatUniScene(self)
         self.cat_scene.active = True
         self.scenes.append(self.cat_scene)
 
@@ -73,11 +112,22 @@ class Game:
         If a scene responds with a truthy value, the tick will
         continue to be propagated.
         """
+        frame_times = self.frame_times
+        start_time = time.perf_counter()
         for i in self.scenes[::-1]:
-            if i.active and not i.tick(time_delta):
-                break
+            if i.active:
+                scene_start_time = time.perf_counter()
+                propagate = i.tick(time_delta)
+                frame_times.record(
+                    "tick " + type(i).__name__, time.perf_counter() - scene_start_time
+                )
+                if not propagate:
+                    break
+        frame_times.record("tick", time.perf_counter() - start_time)
 
-        self.clock.tick(self.FPS)
+        if not self.headless:
+            with frame_times.time("clock wait"):
+                self.clock.tick(self.FPS)
 
     def render(self):
         """Propagate a render to the highest active scene.
@@ -91,45 +141,162 @@ class Game:
         #             break
         # pygame.display.flip()
 
+        frame_times = self.frame_times
+        start_time = time.perf_counter()
         all_rects = []
         for ascene in self.scenes[::-1]:
             if ascene.active:
+                scene_start_time = time.perf_counter()
                 rects = ascene.render()
+                frame_times.record(
+                    "render " + type(ascene).__name__,
+                    time.perf_counter() - scene_start_time,
+                )
                 if rects is not None:
                     all_rects.extend(rects)
                 if not getattr(ascene, "propagate_render", False):
                     break
+        frame_times.record("render", time.perf_counter() - start_time)
         # print(all_rects)
-        pygame.display.update(all_rects)
+        with frame_times.time("display update"):
+            pygame.display.update(all_rects)
 
     def events(self, events):
         """
         Standard event loop. Will propagate events to scenes
         following the same rules as tick and render.
         """
+        start_time = time.perf_counter()
+        scene_times = {}
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                print(self.frame_times.report())
 
             for i in self.scenes[::-1]:
-                if i.active and not i.event(event):
-                    break
+                if i.active:
+                    scene_start_time = time.perf_counter()
+                    propagate = i.event(event)
+                    name = "events " + type(i).__name__
+                    scene_times[name] = scene_times.get(name, 0.0) + (
+                        time.perf_counter() - scene_start_time
+                    )
+                    if not propagate:
+                        break
+        for name, duration in scene_times.items():
+            self.frame_times.record(name, duration)
+        self.frame_times.record("events", time.perf_counter() - start_time)
+
+    def step(self, time_delta):
+        """
+        Advance the game by one frame of time_delta ms.
+
+        Rendering is skipped if the game was made with render=False.
+
+        :param time_delta: The time delta in ms.
+        :return: The events processed this frame.
+        """
+        if self._cat_scene_pending:
+            self._cat_scene_pending = False
+            self.add_cat_scene()
+        # Frames are recorded from the first one the cat scene is ticked in.
+        recording = self.recorder is not None and self.recorder.started
+        self._stepping = True
+        self.tick(time_delta)
+        if self.render_enabled:
+            self.render()
+        events = pygame.event.get()
+        self.events(events)
+        self._stepping = False
+        if recording:
+            self.recorder.record(time_delta, events)
+        return events
+
+    def simulate(self, steps, time_delta=None):
+        """
+        Step the game as fast as the CPU allows, with a fixed time_delta.
+
+        :param steps: How many frames to step.
+        :param time_delta: ms per frame, defaults to 1000 / FPS.
+        :return: The number of steps per second achieved.
+        """
+        if time_delta is None:
+            time_delta = 1000.0 / self.FPS
+        start_time = time.perf_counter()
+        done = 0
+        while done < steps and self.running:
+            self.step(time_delta)
+            done += 1
+        elapsed = time.perf_counter() - start_time
+        return done / elapsed if elapsed > 0 else float("inf")
 
     def mainloop(self):
         """
         Handle the game mainloop until self.running is set to
         a falsey value. Usually form pygame.QUIT.
         """
+        if self.headless:
+            self._headless_mainloop()
+            return
 
         time_delta = 0
         while self.running:
             start_time = time.time()
-            self.tick(time_delta)
-            self.render()
-            events = pygame.event.get()
-            self.events(events)
+            events = self.step(time_delta)
             time_delta = (time.time() - start_time) * 1000
-            if self.gif_maker is not None:
-                self.gif_maker.update(events, self.screen)
+            with self.frame_times.time("gif capture"):
+                self._capture_gif(events)
+
+        self.quit()
+
+    def _capture_gif(self, events):
+        """
+        Pass the frame to the GifMaker, making it when K_g is first pressed.
+
+        :param events: The events of this frame.
+        """
+        if self.gif_maker is None:
+            if not any(
+                event.type == pygame.KEYDOWN and event.key == pygame.K_g
+                for event in events
+            ):
+                return
+            self.gif_maker = self._make_gif_maker()
+        self.gif_maker.update(events, self.screen)
+
+    def _make_gif_maker(self, replay_seconds=None):
+        """
+        :param replay_seconds: How many seconds to keep for an instant replay.
+        :return: A GifMaker recording two seconds at a time.
+        """
+        from stuntcat.gifmaker import (  # pylint:disable=import-outside-toplevel
+            GifMaker,
+        )
+
+        return GifMaker(fps=self.FPS, seconds=2, replay_seconds=replay_seconds)
 
+    def quit(self):
+        """
+        Finish any recording and gif, print the frame times and quit pygame.
+        """
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.gif_maker is not None:
+            self.gif_maker.wait()
+        print(self.frame_times.report())
         pygame.quit()
+
+    def _headless_mainloop(self):
+        """
+        Simulate uncapped with a fixed time_delta, printing the steps/sec.
+        """
+        steps = self.FPS * self.REPORT_INTERVAL
+        while self.running:
+            steps_per_sec = self.simulate(steps)
+            print(
+                "%.0f steps/sec, %.1fx real time"
+                % (steps_per_sec, steps_per_sec / self.FPS)
+            )
+
+        self.quit()
@@ -0,0 +1,239 @@
+""" Animated gifs made with numpy, without ffmpeg or imagemagick.
+
+Every frame uses one shared palette, a 6x6x6 cube of colors, so
+quantizing a pixel is a table lookup. After the first frame only the
+rectangle that changed is stored, with pixels that stayed the same
+left transparent, so a mostly static screen makes small frames that
+LZW compresses well.
+
+::Example::
+
+    >>> with GifEncoder("anim.gif", (960, 540), fps=30) as encoder:
+    ...     encoder.add_frame(pygame.image.tobytes(screen, "RGB"))
+"""
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+# Levels of each of red, green and blue in the palette.
+LEVELS = 6
+# The palette index of the cube color nearest each 0-255 channel value.
+_NEAREST_LEVEL = ((np.arange(256) * (LEVELS - 1) + 127) // 255).astype(np.uint8)
+# Cube colors, then the transparent index, then unused entries up to 256.
+TRANSPARENT = LEVELS ** 3
+_LEVEL_VALUES = np.arange(LEVELS) * 255 // (LEVELS - 1)
+PALETTE = np.zeros((256, 3), np.uint8)
+PALETTE[:TRANSPARENT] = np.stack(
+    np.meshgrid(_LEVEL_VALUES, _LEVEL_VALUES, _LEVEL_VALUES, indexing="ij"), -1
+).reshape(-1, 3)
+
+MIN_CODE_SIZE = 8
+CLEAR_CODE = 1 << MIN_CODE_SIZE
+END_CODE = CLEAR_CODE + 1
+MAX_CODES = 4096
+
+
+def quantize(rgb):
+    """
+    :param rgb: uint8 array of pixels, shaped (height, width, 3).
+    :return: uint8 array of PALETTE indices, shaped (height, width).
+    """
+    levels = _NEAREST_LEVEL[rgb]
+    return (
+        levels[..., 0] * (LEVELS * LEVELS) + levels[..., 1] * LEVELS + levels[..., 2]
+    ).astype(np.uint8)
+
+
+def lzw_encode(indices):
+    """
+    Compress palette indices the way gif image data is.
+
+    :param indices: bytes of palette indices.
+    :return: The packed variable width codes, not yet split into sub-blocks.
+    """
+    out = bytearray()
+    bits = 0  # codes not yet written out, as one int.
+    bit_count = 0
+    code_size = MIN_CODE_SIZE + 1
+
+    def emit(code):
+        nonlocal bits, bit_count
+        bits |= code << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            bit_count -= 8
+
+    emit(CLEAR_CODE)
+    # (prefix code << 8 | next index) -> code.
+    table = {}
+    next_code = END_CODE + 1
+    prefix = None
+    for index in indices:
+        if prefix is None:
+            prefix = index
+            continue
+        key = prefix << 8 | index
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < MAX_CODES:
+            table[key] = next_code
+            # Codes widen as soon as the decoder's table needs them to.
+            if next_code == 1 << code_size:
+                code_size += 1
+            next_code += 1
+        else:
+            emit(CLEAR_CODE)
+            table = {}
+            next_code = END_CODE + 1
+            code_size = MIN_CODE_SIZE + 1
+        prefix = index
+    if prefix is not None:
+        emit(prefix)
+    emit(END_CODE)
+    if bit_count:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+def _sub_blocks(data):
+    """data as gif sub-blocks of up to 255 bytes, with the terminator."""
+    blocks = bytearray()
+    for start in range(0, len(data), 255):
+        chunk = data[start : start + 255]
+        blocks.append(len(chunk))
+        blocks.extend(chunk)
+    blocks.append(0)
+    return bytes(blocks)
+
+
+def changed_rect(previous, current):
+    """
+    :param previous: Palette indices of the last frame.
+    :param current: Palette indices of this frame.
+    :return: (x, y, width, height) around the pixels that differ, or None.
+    """
+    changed = previous != current
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not len(rows):  # pylint:disable=len-as-condition
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return (
+        int(cols[0]),
+        int(rows[0]),
+        int(cols[-1] - cols[0] + 1),
+        int(rows[-1] - rows[0] + 1),
+    )
+
+
+TRAILER = b"\x3b"
+
+
+def header(size):
+    """
+    :param size: (width, height) of the gif.
+    :return: The bytes a looping gif with PALETTE starts with.
+    """
+    return b"".join(
+        [
+            b"GIF89a",
+            # The screen, with a 256 color global palette.
+            struct.pack("<HHBBB", size[0], size[1], 0xF7, 0, 0),
+            PALETTE.tobytes(),
+            # Loop forever.
+            b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00",
+        ]
+    )
+
+
+class GifEncoder:
+    """
+    Writes frames to an animated gif file as they are added.
+
+    With body_only, just the frames are written. As every gif here has the
+    same palette, bodies can be joined between a header() and TRAILER.
+    """
+
+    # pylint:disable=too-many-arguments
+    def __init__(self, path, size, fps=30, first_frame=0, body_only=False):
+        """
+        :param path: The gif file to write.
+        :param size: (width, height) of every frame.
+        :param fps: Frames per second to play back at.
+        :param first_frame: Number of the first frame in the whole gif,
+            so frame delays add up the same across bodies.
+        :param body_only: Leave out the header and trailer.
+        """
+        self.size = size
+        self.fps = fps
+        self.frame_count = first_frame
+        self.body_only = body_only
+        self._previous = None  # Palette indices of the last frame.
+        self._file = open(path, "wb")  # pylint:disable=consider-using-with
+        if not body_only:
+            self._file.write(header(size))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _delay(self):
+        """Hundredths of a second to show the next frame, rounded so they add up."""
+        start = self.frame_count * 100 // self.fps
+        return (self.frame_count + 1) * 100 // self.fps - start
+
+    def add_frame(self, frame):
+        """
+        :param frame: RGB bytes of the frame, or a uint8 array shaped
+            (height, width, 3).
+        """
+        width, height = self.size
+        rgb = np.frombuffer(frame, np.uint8).reshape(height, width, 3)
+        indices = quantize(rgb)
+
+        if self._previous is None:
+            rect = (0, 0, width, height)
+            pixels = indices
+        else:
+            rect = changed_rect(self._previous, indices)
+            if rect is None:
+                # Nothing changed, so one transparent pixel keeps the timing.
+                rect = (0, 0, 1, 1)
+                pixels = np.full((1, 1), TRANSPARENT, np.uint8)
+            else:
+                x, y, rect_width, rect_height = rect
+                area = (slice(y, y + rect_height), slice(x, x + rect_width))
+                # Pixels that didn't change show the last frame through.
+                pixels = np.where(
+                    self._previous[area] == indices[area], TRANSPARENT, indices[area]
+                ).astype(np.uint8)
+        self._previous = indices
+
+        # Graphic control: keep the last frame under this one, transparency on.
+        self._file.write(
+            struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 0x05, self._delay(), TRANSPARENT, 0)
+        )
+        self._file.write(struct.pack("<BHHHHB", 0x2C, rect[0], rect[1], rect[2], rect[3], 0))
+        self._file.write(bytes([MIN_CODE_SIZE]))
+        self._file.write(_sub_blocks(lzw_encode(pixels.tobytes())))
+        self.frame_count += 1
+
+    def close(self):
+        """
+        Finish the file.
+        """
+        if not self._file.closed:
+            if not self.body_only:
+                self._file.write(TRAILER)
+            self._file.close()
@@ -1,9 +1,11 @@
 """ gifmaker is for making gifs with pygame.
 
-It relies on ffmpeg, or convert(from imagemagick being available):
+It uses ffmpeg if it is installed, for its nicer palettes:
 
-    brew install imagemagick ffmpeg
-    apt-get install imagemagick ffmpeg
+    brew install ffmpeg
+    apt-get install ffmpeg
+
+Otherwise the gif is made by stuntcat.gifencoder, with numpy.
 
 ::Example::
 
@@ -13,19 +15,27 @@ It relies on ffmpeg, or convert(from imagemagick being available):
 
 """
 
+import itertools
 import os
+import queue
 import subprocess
+import threading
 import time
 import shutil
 import distutils.spawn
 import pygame as pg
 
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+from stuntcat.gifencoder import GifEncoder
+
 
 # TODO: make it work on windows (tmp path handling fixes)
-# TODO: try to use Pillow if imagemagik/ffmpeg is not installed?
-# TODO: a backend for windows? Pure python gif saving? windows built in gif saving?
-# TODO: ffmpeg backend to pipe data into ffmpeg rather than use tmp files.
-# TODO: async operation for saving.
 # TODO: scaling image to a smaller size.
 
 
@@ -37,6 +47,134 @@ def which(cmd):
     return distutils.spawn.find_executable(cmd)
 
 
+# Posted when a gif is saved, or failed to be, with path and error attributes.
+GIF_SAVED = pg.event.custom_type()
+
+# Numbers the files gifs are made in, before they are moved into place.
+_PART_NUMBERS = itertools.count()
+
+# The palette filter ffmpeg uses to make nicer looking gifs.
+PALETTE_FILTER = "[0:v] split [a][b];[a] palettegen [p];[b][p] paletteuse"
+
+
+class FfmpegPipe:
+    """Streams frames to an ffmpeg process as raw video on its stdin.
+
+    No images get saved and loaded again, and when recording
+    stops ffmpeg only has the frames it already has to encode.
+
+    >>> pipe = FfmpegPipe(which("ffmpeg"), screen.get_size(), 30, "anim.gif")
+    >>> pipe.write(pg.image.tobytes(screen, "RGB"))
+    >>> pipe.close()
+    """
+
+    # pylint:disable=too-many-arguments
+    def __init__(self, ffmpeg_path, size, fps, output_path, output_args=None):
+        """output_args are ffmpeg options for the output, a gif by default."""
+        self.size = size
+        self.output_path = output_path
+        if output_args is None:
+            # use a pallet for the gif for nicer image.
+            output_args = ["-filter_complex", PALETTE_FILTER]
+        cmd = [
+            ffmpeg_path,
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgb24",
+            "-s",
+            "%sx%s" % size,
+            "-framerate",
+            str(fps),
+            "-i",
+            "-",  # frames come from stdin.
+            "-y",  # overwrite output file without asking.
+        ]
+        cmd += output_args
+        cmd += [output_path]
+        print(cmd)
+        # pylint:disable=consider-using-with
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        """Send a frame to ffmpeg, as RGB bytes of the size given to the pipe."""
+        self.process.stdin.write(frame)
+
+    def close(self):
+        """Finish the stream, and wait for ffmpeg to encode it.
+
+        :return: True if ffmpeg made the file.
+        """
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            # ffmpeg already quit, wait() says how.
+            pass
+        return self.process.wait() == 0
+
+
+class ReplayRing:
+    """The last few frames of the screen, in one preallocated buffer.
+
+    Capturing copies the screen into the oldest slot, so it always takes
+    the same memory and allocates nothing big per frame.
+
+    >>> ring = ReplayRing(screen.get_size(), 60)
+    >>> ring.capture(screen)
+    >>> frames = list(ring.frames())
+    """
+
+    def __init__(self, size, length):
+        self.size = size
+        # Indexed [frame, x, y, channel], like surfarray.pixels3d.
+        self.buffer = np.zeros((length, size[0], size[1], 3), np.uint8)
+        self.count = 0
+
+    def capture(self, screen):
+        """Copy screen into the ring, over the oldest frame."""
+        np.copyto(
+            self.buffer[self.count % len(self.buffer)], pg.surfarray.pixels3d(screen)
+        )
+        self.count += 1
+
+    def frames(self):
+        """The frames in the ring, oldest first.
+
+        They are views of the buffer, not copies, so don't capture into
+        the ring until done with them.
+        """
+        length = len(self.buffer)
+        if self.count <= length:
+            yield from self.buffer[: self.count]
+        else:
+            start = self.count % length
+            yield from self.buffer[start:]
+            yield from self.buffer[:start]
+
+
+def _rgb_frames(frames):
+    """RGB bytes of each of frames, from ReplayRing.frames."""
+    for frame in frames:
+        yield frame.transpose(1, 0, 2).tobytes()
+
+
+def _move_part(part_path, output_path, error):
+    """Move a finished gif into place, or remove it if making it failed.
+
+    :return: error, or why the gif could not be moved.
+    """
+    if error is None:
+        try:
+            os.replace(part_path, output_path)
+        except OSError as move_error:
+            error = "could not make %s: %s" % (output_path, move_error)
+    if error is not None and os.path.exists(part_path):
+        os.remove(part_path)
+    return error
+
+
 class GifMaker:
     """For making gif animation of a pygame.
 
@@ -46,10 +184,18 @@ class GifMaker:
     Press K_g to start recording,
           K_g again to finish recording.
 
-    Uses imagemagik 'convert' or ffmpeg tool for making the gif.
+    Uses the ffmpeg tool for making the gif if it is there,
+    or stuntcat.gifencoder if not.
 
-        brew install imagemagick ffmpeg
-        apt-get install imagemagick ffmpeg
+        brew install ffmpeg
+        apt-get install ffmpeg
+
+    Frames are encoded on a worker thread as they come, so the game only
+    copies the screen each frame. A GIF_SAVED event is posted when the gif
+    is done.
+
+    With replay_seconds, the last that many seconds are always kept, and
+    K_r saves them as a gif: an instant replay of what just happened.
 
     ::Example::
 
@@ -59,95 +205,194 @@ class GifMaker:
     >>> gifmaker.update(events, screen)
     """
 
-    def __init__(self, path="/tmp/", fps=30, seconds=None):
+    # How many frames can wait for the encoder before capturing blocks.
+    QUEUE_FRAMES = 60
+
+    # pylint:disable=too-many-arguments
+    def __init__(self, path="/tmp/", fps=30, seconds=None, replay_seconds=None):
         self.path = path
         self.start_saving = False
         self.finished_saving = False
-        self.surfs = []
         self.fps = fps
         self.seconds = seconds
-
-    def _convert(self, image_paths, output_path):
-
-        convert_path = which("convert")
-        if convert_path is None:
-            return False
-
-        cmd = [
-            convert_path,
-            "-delay",
-            "%s,1000" % (1000 // self.fps),
-            "-size",
-            "%sx%s" % (self.surfs[0].get_width(), self.surfs[0].get_height()),
-        ]
-        cmd += image_paths
-        cmd += [output_path]
-        print(cmd)
-        subprocess.call(cmd)
-        return True
-
-    def _ffmpeg(self, output_path):
-        # https://stackoverflow.com/questions/3688870/create-animated-gif-from-a-set-of-jpeg-images
-
-        ffmpeg_path = which("ffmpeg")
-        if ffmpeg_path is None:
-            return False
-
-        cmd = [
-            ffmpeg_path,
-            "-i",
-            os.path.join(self.path, "bla_%05d.png"),
-            "-y",  # overwrite output file without asking.
-            "-framerate",
-            str(self.fps),
-            "-filter_complex",  # use a pallet for the gif for nicer image.
-            "[0:v] split [a][b];[a] palettegen [p];[b][p] paletteuse",
-            output_path,
-        ]
-        print(cmd)
-        subprocess.call(cmd)
-        return True
+        # RGB bytes of frames on their way to the worker, None ends a gif.
+        self.frames = None
+        self.worker = None
+        self.replay_seconds = replay_seconds
+        # Made the size of the screen on the first update.
+        self.replay = None
+        # The ring isn't captured into while a worker reads it.
+        self.saving_replay = False
+
+    def _output_path(self):
+        return "%s/anim.gif" % self.path
+
+    def _replay_path(self):
+        return "%s/replay.gif" % self.path
+
+    def _encode_pipe(self, frames, ffmpeg_path, size, output_path):
+        pipe = FfmpegPipe(ffmpeg_path, size, self.fps, output_path)
+        try:
+            for frame in frames:
+                pipe.write(frame)
+        except BrokenPipeError:
+            # ffmpeg quit early, close() reports it.
+            pass
+        finally:
+            # Even if writing failed some other way, ffmpeg is not left
+            # waiting on stdin.
+            made = pipe.close()
+        if not made:
+            return "ffmpeg could not make %s" % output_path
+        return None
+
+    def _encode_numpy(self, frames, size, output_path):
+        # Only the changed part of each frame is encoded, as it comes.
+        try:
+            with GifEncoder(output_path, size, self.fps) as encoder:
+                for frame in frames:
+                    encoder.add_frame(frame)
+        except OSError as error:
+            return "could not make %s: %s" % (output_path, error)
+        return None
+
+    def _encode(self, frames, size, output_path, previous):
+        """Make the gif from frames, on the worker thread.
+
+        frames is an iterable of RGB bytes. The gif is made in a file of
+        its own as the frames come, then moved to output_path once
+        previous, the worker making the last gif, is done. So gifs are
+        saved in the order they were started, and the game never waits
+        on an earlier gif to hand over frames.
+
+        Whatever goes wrong, the frames are all taken and GIF_SAVED is
+        posted, so the game never blocks waiting for the worker.
+        """
+        root, ext = os.path.splitext(output_path)
+        # Keeping the extension, so ffmpeg knows what to make.
+        part_path = "%s.part%s%s" % (root, next(_PART_NUMBERS), ext)
+        error = None
+        try:
+            ffmpeg_path = which("ffmpeg")
+            if ffmpeg_path is not None:
+                error = self._encode_pipe(frames, ffmpeg_path, size, part_path)
+            else:
+                error = self._encode_numpy(frames, size, part_path)
+        except Exception as exception:  # pylint:disable=broad-except
+            error = "could not make %s: %r" % (output_path, exception)
+        finally:
+            # If encoding stopped early, take the rest of the frames up to
+            # the end of the recording, so capturing never blocks on a full
+            # queue.
+            for _ in frames:
+                pass
+            if previous is not None:
+                previous.join()
+            error = _move_part(part_path, output_path, error)
+            try:
+                pg.event.post(
+                    pg.event.Event(GIF_SAVED, path=output_path, error=error)
+                )
+            except pg.error:
+                # pygame was quit while the gif was being made.
+                pass
+
+    def _start(self, screen):
+        """Start recording, and the worker making the gif."""
+        self.start_saving = time.time()
+        self.finished_saving = False
+        self.frames = queue.Queue(self.QUEUE_FRAMES)
+        self._start_worker(
+            iter(self.frames.get, None), screen.get_size(), self._output_path()
+        )
+        print("recording surfs, press g")
+
+    def _start_worker(self, frames, size, output_path):
+        # Gifs can be saved to the same path, so each worker saves its gif
+        # after the one before has, and the game waits for neither.
+        self.worker = threading.Thread(
+            target=self._encode,
+            args=(frames, size, output_path, self.worker),
+        )
+        self.worker.start()
+
+    def save_replay(self):
+        """Save the last replay_seconds as a gif, on the worker.
+
+        If a gif is being recorded, the replay is saved after it.
+        """
+        if self.saving_replay:
+            print("still saving the last instant replay")
+            return
+        print("saving instant replay")
+        self.saving_replay = True
+        self._start_worker(self._replay_frames(), self.replay.size, self._replay_path())
+
+    def _replay_frames(self):
+        """RGB bytes of the frames in the ring, which captures again after."""
+        try:
+            yield from _rgb_frames(self.replay.frames())
+        finally:
+            self.saving_replay = False
+
+    def _capture(self, screen):
+        """Hand a frame to the worker."""
+        self.frames.put(pg.image.tobytes(screen, "RGB"))
 
     def finish(self):
-        """Called when finished with making the gifs."""
-        print("saving images for gif")
-        output_path = "%s/anim.gif" % self.path
-        image_paths = []
-        for frame_idx, surf in enumerate(self.surfs):
-            image_path = "%s/bla_%05d.png" % (self.path, frame_idx)
-            image_paths.append(image_path)
-            pg.image.save(surf, image_path)
-
-        if not (self._ffmpeg(output_path) or self._convert(image_paths, output_path)):
-            raise ValueError("could not find convert or ffmpeg")
-
-        for image_path in image_paths:
-            os.remove(image_path)
-
-        print("%s saved" % output_path)
+        """Called when finished with making the gifs.
 
+        The worker finishes the gif, see wait().
+        """
+        print("saving gif")
+        self.frames.put(None)
+        self.frames = None
         self.finished_saving = False
         self.start_saving = False
 
+    def wait(self):
+        """Finish any recording, and wait for the gifs being made to be saved."""
+        if self.frames is not None:
+            self.finish()
+        if self.worker is not None:
+            self.worker.join()
+            self.worker = None
+
+    def _event(self, event, screen):
+        if event.type == pg.KEYDOWN and event.key == pg.K_g:
+            if not self.start_saving:
+                self._start(screen)
+            else:
+                self.start_saving = False
+                self.finished_saving = True
+        elif event.type == pg.KEYDOWN and event.key == pg.K_r and self.replay:
+            self.save_replay()
+        elif event.type == GIF_SAVED:
+            if event.error is None:
+                print("%s saved" % event.path)
+            else:
+                print(event.error)
+
     def update(self, events, screen):
         """To integrate with the main program.
 
         Call it once per frame after drawing is done.
         """
         for event in events:
-            if event.type == pg.KEYDOWN and event.key == pg.K_g:
-                if not self.start_saving:
-                    self.start_saving = time.time()
-                    self.finished_saving = False
-                    print("recording surfs, press g")
-                else:
-                    self.start_saving = False
-                    self.finished_saving = True
+            self._event(event, screen)
+
+        if self.replay_seconds is not None:
+            if self.replay is None:
+                self.replay = ReplayRing(
+                    screen.get_size(), int(self.replay_seconds * self.fps)
+                )
+            if not self.saving_replay:
+                self.replay.capture(screen)
 
         if self.finished_saving:
             self.finish()
         if self.start_saving:
-            self.surfs.append(screen.copy())
+            self._capture(screen)
             if (
                 self.seconds is not None
                 and time.time() - self.start_saving > self.seconds
@@ -1,7 +1,11 @@
 """
 Main module
 """
+import sys
+import time
+
 from stuntcat.game import Game
+from stuntcat.replay import Recorder, Replayer
 
 
 def main():
@@ -15,8 +19,53 @@ def main():
         print("Exiting")
 
 
+def _option(name):
+    """
+    The value following name on the command line, or None.
+
+    :param name: The option, like "--record".
+    """
+    if name in sys.argv[:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
+
+
 def game_main():
     """
     Game main function.
+
+    Pass --headless to simulate as fast as possible without a window,
+    and --no-render to skip rendering as well.
+    Pass --record FILE to record the session, and --replay FILE to
+    play a recording back headless.
+    Pass --instant-replay SECONDS to keep that many seconds of frames,
+    which the R key saves as a gif.
     """
-    Game().mainloop()
+    headless = "--headless" in sys.argv
+    render = "--no-render" not in sys.argv
+
+    replay_path = _option("--replay")
+    if replay_path is not None:
+        replayer = Replayer(replay_path)
+        start_time = time.perf_counter()
+        game = replayer.run(render=render)
+        elapsed = time.perf_counter() - start_time
+        frames = sum(1 for _ in replayer.frames())
+        print(
+            "replayed %s frames in %.2f seconds, score %s"
+            % (frames, elapsed, game.cat_scene.player_data.score)
+        )
+        game.quit()
+        return
+
+    record_path = _option("--record")
+    recorder = None if record_path is None else Recorder(record_path)
+    instant_replay = _option("--instant-replay")
+    if instant_replay is not None:
+        instant_replay = float(instant_replay)
+    Game(
+        headless=headless,
+        render=render,
+        recorder=recorder,
+        instant_replay=instant_replay,
+    ).mainloop()
@@ -0,0 +1,111 @@
+""" Small pixel observations of a scene, for bots that learn from pixels.
+
+::Example::
+
+    >>> observer = PixelObserver(game.cat_scene, size=(96, 54), stack=4)
+    >>> frames = observer.observe()  # shape (4, 54, 96), uint8
+
+The scene draws into its own full size canvas, which is scaled into a
+small surface. The small surface is read through a pygame.surfarray view
+that is made once, and frames go into a preallocated stack, so nothing
+is allocated per frame.
+"""
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+import pygame
+
+# ITU-R 601 luma weights for turning rgb into grayscale.
+LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class PixelObserver:  # pylint:disable=too-many-instance-attributes
+    """
+    Renders a scene into a small offscreen surface, as numpy arrays.
+    """
+
+    def __init__(self, scene, size=(96, 54), grayscale=True, stack=1, smooth=True):
+        """
+        :param scene: The scene to observe. It is given its own canvas to draw on.
+        :param size: (width, height) of the observations.
+        :param grayscale: One luma channel rather than rgb.
+        :param stack: How many of the latest frames observe returns.
+        :param smooth: Scale with smoothscale, rather than nearest neighbour.
+        """
+        self.scene = scene
+        self.size = size
+        self.grayscale = grayscale
+        self.stack = stack
+        self.smooth = smooth
+
+        self.canvas = pygame.Surface(scene.screen.get_size(), 0, 32)
+        self.small = pygame.Surface(size, 0, 32)
+        # Holding on to this keeps self.small locked, which scaling into it allows.
+        self._pixels = pygame.surfarray.pixels3d(self.small).transpose(1, 0, 2)
+
+        width, height = size
+        shape = (height, width) if grayscale else (height, width, 3)
+        # Every frame is written twice, stack frames apart, so the latest
+        # stack frames are always one contiguous slice of this.
+        self._frames = np.zeros((2 * stack,) + shape, dtype=np.uint8)
+        self._gray = np.zeros((height, width), dtype=np.float32)
+        self._next = 0
+
+        # Where the scene drew before, given back by close.
+        self._screen = scene.screen
+        self.use_canvas()
+
+    def use_canvas(self):
+        """
+        Make the scene draw everything into our canvas on its next render.
+        """
+        self.scene.screen = self.canvas
+        self.scene.allsprites.clear(self.canvas, self.scene.background)
+        self.scene.allsprites.repaint_rect(self.canvas.get_rect())
+
+    def close(self):
+        """
+        Make the scene draw to the screen it drew to before again.
+        """
+        self.scene.screen = self._screen
+        self.scene.allsprites.clear(self._screen, self.scene.background)
+        self.scene.allsprites.repaint_rect(self._screen.get_rect())
+
+    def reset(self):
+        """
+        Forget the stacked frames, like at the start of an episode.
+        """
+        self._frames[:] = 0
+        self._next = 0
+
+    def observe(self, render=True):
+        """
+        Capture a frame of the scene.
+
+        :param render: Render the scene first. Pass False if it was rendered
+            already this frame.
+        :return: The latest frames, oldest first, with shape
+            (stack, height, width) or (stack, height, width, 3). It is a view
+            that the next observe call changes, copy it to keep it.
+        """
+        if render:
+            self.scene.render()
+        if self.smooth:
+            pygame.transform.smoothscale(self.canvas, self.size, self.small)
+        else:
+            pygame.transform.scale(self.canvas, self.size, self.small)
+
+        idx = self._next
+        frame = self._frames[idx]
+        if self.grayscale:
+            np.dot(self._pixels, LUMA, out=self._gray)
+            np.copyto(frame, self._gray, casting="unsafe")
+        else:
+            np.copyto(frame, self._pixels)
+        self._frames[idx + self.stack] = frame
+        self._next = (idx + 1) % self.stack
+        return self._frames[self._next : self._next + self.stack]
@@ -0,0 +1,82 @@
+""" Sounds decoded once, and kept on disk as raw PCM for the next start.
+
+Decoding the OGG sound effects is slow. The decoded samples are saved in
+the mixer's format, named by a hash of the source file and the format,
+and later loaded with Sound(buffer=...) from a memory map.
+
+The cache is in $STUNTCAT_CACHE_DIR, or stuntcat/sounds under
+$XDG_CACHE_HOME (~/.cache by default). Delete it any time.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+
+import pygame
+
+
+def cache_dir():
+    """
+    :return: The directory decoded sounds are kept in.
+    """
+    path = os.environ.get("STUNTCAT_CACHE_DIR")
+    if path:
+        return path
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "stuntcat", "sounds")
+
+
+def cache_path(path, mixer_format):
+    """
+    :param path: The source sound file.
+    :param mixer_format: (frequency, size, channels) from pygame.mixer.get_init().
+    :return: Where the decoded samples of path in mixer_format are kept.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as afile:
+        for chunk in iter(lambda: afile.read(1 << 16), b""):
+            digest.update(chunk)
+    frequency, size, channels = mixer_format
+    return os.path.join(
+        cache_dir(),
+        "%s-%s-%s-%s.pcm" % (digest.hexdigest(), frequency, size, channels),
+    )
+
+
+def load(path):
+    """
+    Load a sound, from the decoded cache if it is there, adding it if not.
+
+    :param path: The source sound file.
+    :return: The pygame.mixer.Sound.
+    """
+    pcm_path = cache_path(path, pygame.mixer.get_init())
+    try:
+        with open(pcm_path, "rb") as afile:
+            with mmap.mmap(afile.fileno(), 0, access=mmap.ACCESS_READ) as samples:
+                return pygame.mixer.Sound(buffer=samples)
+    except (OSError, ValueError):
+        # Missing, or empty so it can't be mapped.
+        pass
+
+    sound = pygame.mixer.Sound(path)
+    try:
+        os.makedirs(os.path.dirname(pcm_path), exist_ok=True)
+        # Written to the side and renamed, so a partial file is never read.
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(pcm_path))
+    except OSError:
+        # A read only home still plays sounds, only slower to start.
+        return sound
+    try:
+        with os.fdopen(handle, "wb") as afile:
+            afile.write(sound.get_raw())
+        os.replace(tmp_path, pcm_path)
+    except OSError:
+        # Like a full disk. Don't leave the partial file behind.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return sound
@@ -0,0 +1,23 @@
+""" Starting worker processes from a process that runs pygame.
+
+::Example::
+
+    >>> with worker_context().Pool(4) as pool:
+    ...     results = pool.map(work, jobs)
+"""
+import multiprocessing
+
+
+def worker_context():
+    """
+    The multiprocessing context to start workers with.
+
+    Workers are forked from a clean server process where there is one.
+    Forking this one can deadlock if it has pygame running.
+
+    :return: A forkserver context, or a spawn one where there is no forkserver.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
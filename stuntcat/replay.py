@@ -0,0 +1,191 @@
+""" Record the inputs of a game, and replay them exactly.
+
+All the randomness in the game comes from the random module, and all the
+timing from the time_delta passed to Game.tick. So a log of the seed, the
+time_delta of every frame and the input events of every frame is enough
+to play a session again, bit for bit.
+
+::Example::
+
+    >>> game = Game(recorder=Recorder("session.rec"))
+    >>> game.mainloop()
+    >>> game = Replayer("session.rec").run()
+
+The log is binary: a header, then for every frame its time_delta and
+its events packed with struct.
+"""
+import random
+import struct
+
+import pygame
+
+MAGIC = b"SCRP"
+VERSION = 1
+
+# magic, version, seed, fps
+HEADER = struct.Struct("<4sHQH")
+# time_delta, number of events
+FRAME = struct.Struct("<dH")
+# type, code, value, value2
+EVENT = struct.Struct("<Iidd")
+
+# The events scenes react to, and the attribute stored as each one's code.
+EVENT_CODES = {
+    pygame.QUIT: None,
+    pygame.KEYDOWN: "key",
+    pygame.KEYUP: "key",
+    pygame.MOUSEBUTTONDOWN: "button",
+    pygame.JOYBUTTONDOWN: "button",
+    pygame.JOYBUTTONUP: "button",
+    pygame.JOYAXISMOTION: "axis",
+    pygame.JOYHATMOTION: "hat",
+}
+
+
+def pack_event(event):
+    """
+    Pack an event into bytes.
+
+    :param event: A pygame event of one of the EVENT_CODES types.
+    :return: The packed event.
+    """
+    code_attr = EVENT_CODES[event.type]
+    code = getattr(event, code_attr) if code_attr else 0
+    value = value2 = 0.0
+    if event.type == pygame.JOYAXISMOTION:
+        value = event.value
+    elif event.type == pygame.JOYHATMOTION:
+        value, value2 = event.value
+    elif event.type == pygame.MOUSEBUTTONDOWN:
+        value, value2 = event.pos
+    return EVENT.pack(event.type, code, value, value2)
+
+
+def unpack_event(data, offset=0):
+    """
+    Unpack an event packed by pack_event.
+
+    :param data: The bytes to unpack from.
+    :param offset: Where the event starts in data.
+    :return: The pygame event.
+    """
+    event_type, code, value, value2 = EVENT.unpack_from(data, offset)
+    attrs = {}
+    code_attr = EVENT_CODES[event_type]
+    if code_attr:
+        attrs[code_attr] = code
+    if event_type == pygame.JOYAXISMOTION:
+        attrs["value"] = value
+    elif event_type == pygame.JOYHATMOTION:
+        attrs["value"] = (int(value), int(value2))
+    elif event_type == pygame.MOUSEBUTTONDOWN:
+        attrs["pos"] = (int(value), int(value2))
+    return pygame.event.Event(event_type, attrs)
+
+
+class Recorder:
+    """
+    Records the seed, time_delta and input events of every frame.
+
+    Give it to a Game. It seeds the random module when the cat scene is
+    added, and records every frame after that.
+    """
+
+    def __init__(self, path, seed=None):
+        """
+        :param path: Where to write the log.
+        :param seed: Seed for the random module, a random one by default.
+        """
+        self.path = path
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.started = False
+        self.frames = 0
+        self._file = None
+
+    def start(self, fps):
+        """
+        Seed the random module and start the log.
+
+        :param fps: The frame rate of the game, stored in the log.
+        """
+        random.seed(self.seed)
+        # pylint:disable=consider-using-with
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.seed, fps))
+        self.started = True
+
+    def record(self, time_delta, events):
+        """
+        Record a frame.
+
+        :param time_delta: The time_delta the frame was ticked with.
+        :param events: The events processed in the frame.
+        """
+        packed = [pack_event(event) for event in events if event.type in EVENT_CODES]
+        self._file.write(FRAME.pack(time_delta, len(packed)))
+        self._file.write(b"".join(packed))
+        self.frames += 1
+
+    def close(self):
+        """
+        Finish the log.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Replayer:
+    """
+    Plays a log made by Recorder through Game.tick and Game.events.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The log to play.
+        """
+        with open(path, "rb") as afile:
+            self._data = afile.read()
+        magic, version, self.seed, self.fps = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("%s is not a stuntcat recording" % path)
+
+    def frames(self):
+        """
+        The frames of the log.
+
+        :return: A generator of (time_delta, events) for every frame.
+        """
+        data = self._data
+        offset = HEADER.size
+        while offset < len(data):
+            time_delta, num_events = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            events = []
+            for _ in range(num_events):
+                events.append(unpack_event(data, offset))
+                offset += EVENT.size
+            yield time_delta, events
+
+    def run(self, game=None, render=False):
+        """
+        Play the whole log, as fast as possible.
+
+        :param game: A headless Game made after seeding with self.seed.
+            One is made by default.
+        :param render: Render the frames too.
+        :return: The game, in the state the recorded session finished in.
+        """
+        if game is None:
+            # Game seeds nothing itself, so this seeds the cat scene.
+            random.seed(self.seed)
+            # pylint:disable=import-outside-toplevel,cyclic-import
+            from stuntcat.game import Game
+
+            game = Game(headless=True, render=render)
+        for time_delta, events in self.frames():
+            game.tick(time_delta)
+            if render:
+                game.render()
+            game.events(events)
+        return game
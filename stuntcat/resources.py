@@ -1,12 +1,165 @@
 """ For loading resources.
 """
+import functools
 import os
+import threading
+from collections import OrderedDict
 
 import pygame
 
+from stuntcat import bundle
+from stuntcat import pcmcache
 
-_SFX_CACHE = {}
-_GFX_CACHE = {}
+
+class ResourceCache:
+    """
+    A least recently used cache, bounded by the bytes its values take.
+
+    Pinned keys are never evicted, but still count towards the bytes.
+
+    ::Example::
+
+    cache = ResourceCache(64 * 1024 * 1024, surface_bytes)
+    cache.pin("background.png")
+    cache.put("background.png", surface)
+    print(cache.stats())
+    """
+
+    def __init__(self, max_bytes, sizeof):
+        """
+        :param max_bytes: Evict least recently used values past this many bytes.
+        :param sizeof: Called with a value to find how many bytes it takes.
+        """
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._values = OrderedDict()  # key -> (value, bytes)
+        self._pinned = set()
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key, default=None):
+        """
+        :param key:
+        :param default: Returned when key is not cached.
+        :return: The value for key, marked as the most recently used.
+        """
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._values.move_to_end(key)
+        return value[0]
+
+    def put(self, key, value):
+        """
+        Cache value for key, evicting others if that goes over max_bytes.
+
+        :param key:
+        :param value:
+        """
+        self.discard(key)
+        nbytes = self.sizeof(value)
+        self._values[key] = (value, nbytes)
+        self.resident_bytes += nbytes
+        if self.resident_bytes > self.max_bytes:
+            self._evict()
+
+    def discard(self, key):
+        """
+        Remove key if it is cached.
+
+        :param key:
+        """
+        value = self._values.pop(key, None)
+        if value is not None:
+            self.resident_bytes -= value[1]
+
+    def pin(self, key):
+        """
+        Never evict key, even if it isn't cached yet.
+
+        :param key:
+        """
+        self._pinned.add(key)
+
+    def unpin(self, key):
+        """
+        Let key be evicted again.
+
+        :param key:
+        """
+        self._pinned.discard(key)
+        if self.resident_bytes > self.max_bytes:
+            self._evict()
+
+    def clear(self):
+        """
+        Remove every value, pinned or not.
+        """
+        self._values.clear()
+        self.resident_bytes = 0
+
+    def stats(self):
+        """
+        :return: dict of hits, misses, evictions, items, resident_bytes and max_bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "items": len(self._values),
+            "resident_bytes": self.resident_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _evict(self):
+        for key in list(self._values):
+            if self.resident_bytes <= self.max_bytes:
+                break
+            if key not in self._pinned:
+                self.discard(key)
+                self.evictions += 1
+
+
+def surface_bytes(surface):
+    """
+    :return: The bytes of pixels a surface holds.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound):
+    """
+    :return: The bytes of samples a sound holds.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+
+# Budgets for the loaded images and sounds. Everything the game has
+# loaded fits several times over, so eviction only happens with more
+# levels or in long running processes making lots of variants.
+GFX_CACHE_BYTES = 64 * 1024 * 1024
+SFX_CACHE_BYTES = 64 * 1024 * 1024
+
+_GFX_CACHE = ResourceCache(GFX_CACHE_BYTES, surface_bytes)
+_SFX_CACHE = ResourceCache(SFX_CACHE_BYTES, sound_bytes)
+
+
+def cache_stats():
+    """
+    :return: {"gfx": stats, "sfx": stats} of the image and sound caches.
+    """
+    return {"gfx": _GFX_CACHE.stats(), "sfx": _SFX_CACHE.stats()}
 
 
 def distance(pos_a, pos_b):
@@ -64,6 +217,14 @@ def music_path(amusic):
     return os.path.join(data_path(), "sounds", amusic)
 
 
+@functools.lru_cache(maxsize=None)
+def _image_bundle():
+    """
+    :return: The images.bundle built by stuntcat.bundle, None if there isn't one.
+    """
+    return bundle.load(os.path.join(data_path(), "images"))
+
+
 def gfx(image, convert=False, convert_alpha=False):
     """
     Load and return an image surface from the image data directory.
@@ -74,16 +235,21 @@ def gfx(image, convert=False, convert_alpha=False):
     :return: Image surface.
     """
     gfx_key = (image, convert, convert_alpha)
-    if gfx_key in _GFX_CACHE:
-        return _GFX_CACHE[gfx_key]
+    asurf = _GFX_CACHE.get(gfx_key)
+    if asurf is not None:
+        return asurf
 
-    path = os.path.join(data_path(), "images", image)
-    asurf = pygame.image.load(path)
+    image_bundle = _image_bundle()
+    if image_bundle is not None and image in image_bundle:
+        asurf = image_bundle.image(image)
+    else:
+        path = os.path.join(data_path(), "images", image)
+        asurf = pygame.image.load(path)
     if convert:
         asurf = asurf.convert()
     if convert_alpha:
         asurf = asurf.convert_alpha()
-    _GFX_CACHE[gfx_key] = asurf
+    _GFX_CACHE.put(gfx_key, asurf)
     return asurf
 
 
@@ -100,12 +266,11 @@ def sfx(snd, play=False, stop=False, fadeout=None, fadein=0, loops=0):
     :return: The sound.
     """
     snd_key = snd
-    if snd_key in _SFX_CACHE:
-        asound = _SFX_CACHE[snd_key]
-    else:
+    asound = _SFX_CACHE.get(snd_key)
+    if asound is None:
         path = os.path.join(data_path(), "sounds", snd)
-        asound = pygame.mixer.Sound(path)
-        _SFX_CACHE[snd_key] = asound
+        asound = pcmcache.load(path)
+        _SFX_CACHE.put(snd_key, asound)
 
     # print(snd_key, play, stop, time.time())
     if play:
@@ -115,3 +280,155 @@ def sfx(snd, play=False, stop=False, fadeout=None, fadein=0, loops=0):
     if fadeout:
         asound.fadeout(fadeout)
     return asound
+
+
+class RotationCache:
+    """
+    Rotated copies of images, with the angle rounded to step degrees.
+
+    Least recently used rotations are dropped past max_bytes of pixels.
+    Images are keyed by identity, so the same source surface has to be
+    passed in each time, a copy will miss.
+
+    ::Example::
+
+    ROTATIONS = RotationCache(max_bytes=16 * 1024 * 1024)
+    image = ROTATIONS.get(frame, 33.3)
+    """
+
+    def __init__(
+        self, max_bytes=16 * 1024 * 1024, step=1.0, rotate=pygame.transform.rotate
+    ):
+        """
+        :param max_bytes: How many bytes of rotated images to keep.
+        :param step: Size in degrees of the angle buckets.
+        :param rotate: Called with (image, angle) to make a rotated image.
+        """
+        self.step = step
+        self.rotate = rotate
+        # (id(image), bucket) -> (image, rotated). Holding on to the source
+        # image means its id can not be reused while it is in here.
+        self._rotated = ResourceCache(max_bytes, lambda value: surface_bytes(value[1]))
+
+    def __len__(self):
+        return len(self._rotated)
+
+    @property
+    def hits(self):
+        """How many gets found their rotation cached."""
+        return self._rotated.hits
+
+    @property
+    def misses(self):
+        """How many gets had to rotate."""
+        return self._rotated.misses
+
+    def stats(self):
+        """
+        :return: The ResourceCache.stats of the rotations.
+        """
+        return self._rotated.stats()
+
+    def get(self, image, angle):
+        """
+        :param image: The surface to rotate.
+        :param angle: Degrees counter clockwise.
+        :return: image rotated by angle rounded to the nearest step.
+        """
+        # Angles a whole turn apart are the same bucket, so spinning
+        # things keep hitting the same rotations.
+        bucket = int(round(angle / self.step)) % int(round(360 / self.step))
+        key = (id(image), bucket)
+        rotated = self._rotated.get(key)
+        if rotated is not None:
+            return rotated[1]
+
+        rotated = self.rotate(image, bucket * self.step)
+        self._rotated.put(key, (image, rotated))
+        return rotated
+
+    def prewarm(self, images, angles):
+        """
+        Rotate every image to every angle now, rather than during play.
+
+        :param images: Surfaces to rotate.
+        :param angles: Degrees to rotate them to.
+        """
+        for image in images:
+            for angle in angles:
+                self.get(image, angle)
+
+    def clear(self):
+        """
+        Drop all the rotated images.
+        """
+        self._rotated.clear()
+
+
+class Preloader:
+    """
+    Load images and sounds on a worker thread, into the caches gfx and sfx use.
+
+    Decoding happens off the main thread, so a loading screen keeps its
+    frame rate, and the gfx and sfx calls of the next scene are cache hits.
+
+    ::Example::
+
+    preloader = Preloader([("background.png", True, False)], ["splash.ogg"])
+    preloader.start()
+    # ... every frame, draw preloader.progress
+    preloader.join()
+    """
+
+    def __init__(self, images=(), sounds=(), pin=False):
+        """
+        :param images: (image, convert, convert_alpha) tuples, as gfx takes.
+        :param sounds: Sound file names, as sfx takes.
+        :param pin: Pin them all in the caches, so they are never evicted.
+        """
+        if pin:
+            for image in images:
+                _GFX_CACHE.pin(tuple(image))
+            for sound in sounds:
+                _SFX_CACHE.pin(sound)
+        self._jobs = [functools.partial(gfx, *image) for image in images]
+        self._jobs.extend(functools.partial(sfx, sound) for sound in sounds)
+        self.loaded = 0
+        self.error = None  # The exception loading stopped with, if any.
+        self._thread = threading.Thread(target=self._load, daemon=True)
+
+    @property
+    def progress(self):
+        """
+        :return: Fraction of the assets loaded, from 0 to 1.
+        """
+        return self.loaded / len(self._jobs) if self._jobs else 1.0
+
+    @property
+    def finished(self):
+        """
+        :return: True once loading stopped, done or not.
+        """
+        return self.loaded == len(self._jobs) or self.error is not None
+
+    def start(self):
+        """
+        Start loading on the worker thread.
+        """
+        self._thread.start()
+
+    def join(self):
+        """
+        Wait for loading to finish.
+        """
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _load(self):
+        try:
+            for job in self._jobs:
+                job()
+                self.loaded += 1
+        except (pygame.error, OSError) as error:
+            # Whatever failed gets loaded, and raises, when the scene asks for it.
+            self.error = error
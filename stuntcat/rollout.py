@@ -0,0 +1,266 @@
+""" Run many headless cat unicycle scenes in parallel worker processes.
+
+Each worker runs a VecEnv and writes what happens into ring buffers in
+shared memory, so nothing is pickled through pipes and the parent reads
+the observations through zero copy numpy views.
+
+::Example::
+
+    >>> with RolloutFarm(num_workers=4, num_envs=8) as farm:
+    ...     farm.run(steps=1000)
+    ...     latest = farm.buffer.latest(0)
+
+Run ``python -m stuntcat.rollout`` for a throughput report per worker count.
+"""
+import os
+import random
+import time
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+from stuntcat.env import OBSERVATION_SIZE, NUM_ACTIONS
+from stuntcat.processes import worker_context
+
+# Arrays in the shared memory start on cache line boundaries.
+ALIGNMENT = 64
+
+
+class RolloutBuffer:
+    """
+    Ring buffers in one shared memory block, one ring per worker.
+
+    Worker w writes its step t into slot t % length of its ring, then sets
+    heads[w] to t + 1. Every array is a numpy view of the shared memory.
+    """
+
+    def __init__(self, num_workers, num_envs, length, name=None):
+        """
+        :param num_workers: How many rings.
+        :param num_envs: Environments stepped by each worker.
+        :param length: Steps kept in each ring.
+        :param name: Attach to an existing buffer, instead of making one.
+        """
+        self.num_workers = num_workers
+        self.num_envs = num_envs
+        self.length = length
+        ring = (num_workers, length, num_envs)
+        self._layout = (
+            ("observations", ring + (OBSERVATION_SIZE,), np.float32),
+            ("actions", ring, np.int8),
+            ("rewards", ring, np.float32),
+            ("dones", ring, np.bool_),
+            ("heads", (num_workers,), np.int64),
+        )
+        size = 0
+        for _, shape, dtype in self._layout:
+            size = _align(size) + int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        (  # pylint:disable=unbalanced-tuple-unpacking
+            self.observations,
+            self.actions,
+            self.rewards,
+            self.dones,
+            self.heads,
+        ) = self._map_arrays()
+        if self.owner:
+            self.heads[:] = 0
+
+    def _map_arrays(self):
+        """
+        :return: numpy views of the shared memory, one for each array in _layout.
+        """
+        arrays = []
+        offset = 0
+        for _, shape, dtype in self._layout:
+            offset = _align(offset)
+            array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+            arrays.append(array)
+            offset += array.nbytes
+        return arrays
+
+    def __getstate__(self):
+        # Workers attach to the shared memory by name.
+        return (self.num_workers, self.num_envs, self.length, self.shm.name)
+
+    def __setstate__(self, state):
+        self.__init__(*state)  # pylint:disable=unnecessary-dunder-call
+
+    def write(self, worker, observations, actions, rewards, dones):
+        """
+        Write one step of a worker's environments into its ring.
+
+        :param worker: Index of the worker.
+        """
+        step = int(self.heads[worker])
+        slot = step % self.length
+        self.observations[worker, slot] = observations
+        self.actions[worker, slot] = actions
+        self.rewards[worker, slot] = rewards
+        self.dones[worker, slot] = dones
+        self.heads[worker] = step + 1
+
+    def latest(self, worker):
+        """
+        The most recent step a worker wrote.
+
+        :param worker: Index of the worker.
+        :return: (observations, actions, rewards, dones) views, or None.
+        """
+        step = int(self.heads[worker])
+        if not step:
+            return None
+        slot = (step - 1) % self.length
+        return (
+            self.observations[worker, slot],
+            self.actions[worker, slot],
+            self.rewards[worker, slot],
+            self.dones[worker, slot],
+        )
+
+    def close(self, unlink=True):
+        """
+        Let go of the shared memory, and free it if this buffer made it.
+
+        :param unlink: False to leave it for others, like the workers do.
+        """
+        for attr, _, _ in self._layout:
+            setattr(self, attr, None)
+        self.shm.close()
+        if self.owner and unlink:
+            self.shm.unlink()
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def random_policy(observations, rng):
+    """
+    Pick a random action for every environment.
+
+    :param observations: The observations of the environments.
+    :param rng: A numpy random Generator.
+    """
+    return rng.integers(NUM_ACTIONS, size=len(observations))
+
+
+def _worker(buffer, worker, steps, policy, seed):
+    """
+    Run in a worker process: step a VecEnv and write it into the buffer.
+    """
+    # Imported here so the parent doesn't need pygame up to make a buffer.
+    from stuntcat.env import VecEnv  # pylint:disable=import-outside-toplevel
+
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    envs = VecEnv(buffer.num_envs)
+    observations = envs.reset()
+    for _ in range(steps):
+        actions = policy(observations, rng)
+        observations, rewards, dones = envs.step(actions)
+        buffer.write(worker, observations, actions, rewards, dones)
+    buffer.close(unlink=False)
+
+
+class RolloutFarm:
+    """
+    Worker processes each stepping their own headless scenes.
+    """
+
+    def __init__(
+        self, num_workers=None, num_envs=8, length=256, policy=None, seed=0
+    ):  # pylint:disable=too-many-arguments
+        """
+        :param num_workers: Worker processes, one per core by default.
+        :param num_envs: Scenes stepped by each worker.
+        :param length: Steps kept in each worker's ring buffer.
+        :param policy: policy(observations, rng) -> actions, random by default.
+            It is pickled to send it to the workers.
+        :param seed: Worker w is seeded with seed + w.
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.num_envs = num_envs
+        self.policy = random_policy if policy is None else policy
+        self.seed = seed
+        self.buffer = RolloutBuffer(self.num_workers, num_envs, length)
+
+        self._context = worker_context()
+
+    def run(self, steps):
+        """
+        Step every worker's scenes steps times, and wait for them to finish.
+
+        :param steps: Steps for each worker.
+        :return: Environment steps per second, over all the workers.
+        """
+        start_time = time.perf_counter()
+        processes = [
+            self._context.Process(
+                target=_worker,
+                args=(self.buffer, worker, steps, self.policy, self.seed + worker),
+                daemon=True,
+            )
+            for worker in range(self.num_workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            if process.exitcode:
+                raise RuntimeError("rollout worker failed: %s" % process.exitcode)
+        elapsed = time.perf_counter() - start_time
+        return self.num_workers * self.num_envs * steps / elapsed
+
+    def close(self):
+        """
+        Free the shared memory.
+        """
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def throughput_report(worker_counts=None, num_envs=8, steps=300):
+    """
+    Print environment steps per second for different numbers of workers.
+
+    :param worker_counts: Worker counts to try, powers of two up to the
+        number of cores by default.
+    :param num_envs: Scenes stepped by each worker.
+    :param steps: Steps for each worker.
+    :return: dict of worker count to steps per second.
+    """
+    if worker_counts is None:
+        cores = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cores:
+            worker_counts.append(worker_counts[-1] * 2)
+
+    report = {}
+    for num_workers in worker_counts:
+        with RolloutFarm(num_workers, num_envs=num_envs) as farm:
+            report[num_workers] = farm.run(steps)
+        print(
+            "%3d workers: %10.0f env steps/sec, %8.0f per worker"
+            % (num_workers, report[num_workers], report[num_workers] / num_workers)
+        )
+    return report
+
+
+if __name__ == "__main__":
+    throughput_report()
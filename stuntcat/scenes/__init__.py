@@ -1,14 +1,31 @@
 """
 Scenes module.
+
+Scenes are imported the first time they are used, so starting the game
+doesn't pay for ones it never shows, like the platformer and pymunk.
 """
+import importlib
+from typing import TYPE_CHECKING
 
 from stuntcat.scenes.scene import Scene
-from .gameover import GameOverScene
-from .loading import LoadingScene
-from .news import NewsScene
-from .settings import SettingsScene
-from .unisharklazer import CatUniScene
-from .platformer.platformer import PlatformerScene
+
+if TYPE_CHECKING:
+    from .gameover import GameOverScene
+    from .loading import LoadingScene
+    from .news import NewsScene
+    from .settings import SettingsScene
+    from .unisharklazer import CatUniScene
+    from .platformer.platformer import PlatformerScene
+
+# Scene class name -> module it is in, relative to this package.
+_SCENE_MODULES = {
+    "GameOverScene": ".gameover",
+    "LoadingScene": ".loading",
+    "NewsScene": ".news",
+    "SettingsScene": ".settings",
+    "CatUniScene": ".unisharklazer",
+    "PlatformerScene": ".platformer.platformer",
+}
 
 __all__ = [
     "Scene",
@@ -19,3 +36,21 @@ __all__ = [
     "CatUniScene",
     "PlatformerScene",
 ]
+
+
+def __getattr__(name):
+    """
+    Import the module of a scene on first use.
+
+    :param name: A scene class name.
+    :return: The scene class.
+    """
+    if name not in _SCENE_MODULES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    scene = getattr(importlib.import_module(_SCENE_MODULES[name], __name__), name)
+    globals()[name] = scene
+    return scene
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
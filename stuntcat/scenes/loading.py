@@ -4,7 +4,11 @@ Loading module.
 import pygame as pg
 
 from .scene import Scene
-from ..resources import gfx, music
+from .unisharklazer import CatUniScene
+from ..resources import gfx, music, Preloader
+
+PROGRESS_RECT = pg.Rect(0, 530, 960, 10)
+PROGRESS_COLOR = (255, 255, 255)
 
 
 class LoadingScene(Scene):
@@ -18,15 +22,39 @@ class LoadingScene(Scene):
         # Loading screen should always be a fallback active scene
         self.active = True
         self.image = gfx("intro_screen.png", convert=True)
+        self.first_render = True
+        self.drawn_progress = 0
         music("mainmenu.ogg", play=True)
 
+        # Load the cat scene's assets while this one shows, so it starts at once.
+        # It is the whole game, so they are kept for good.
+        self.preloader = Preloader(CatUniScene.IMAGES, CatUniScene.SOUNDS, pin=True)
+        self.preloader.start()
+
     def render(self):
         """
         Render the scene.
         """
-        self.screen.fill((255, 0, 255))
-        self.screen.blit(self.image, [0, 0])
-        return [self.screen.get_rect()]
+        rects = []
+        if self.first_render:
+            self.first_render = False
+            self.screen.fill((255, 0, 255))
+            self.screen.blit(self.image, [0, 0])
+            rects.append(self.screen.get_rect())
+
+        # Only the part of the progress bar that grew gets drawn.
+        width = int(PROGRESS_RECT.width * self.preloader.progress)
+        if width > self.drawn_progress:
+            rect = pg.Rect(
+                PROGRESS_RECT.x + self.drawn_progress,
+                PROGRESS_RECT.y,
+                width - self.drawn_progress,
+                PROGRESS_RECT.height,
+            )
+            self.screen.fill(PROGRESS_COLOR, rect)
+            rects.append(rect)
+            self.drawn_progress = width
+        return rects
 
     def tick(self, time_delta):
         """
@@ -41,6 +69,7 @@ class LoadingScene(Scene):
         """
         Progress to next scene.
         """
+        self.preloader.join()
         self._game.scenes.remove(self)
         self._game.add_cat_scene()
         self.active = False
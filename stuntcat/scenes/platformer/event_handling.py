@@ -39,7 +39,7 @@ class EventQueueHandler:
         Print the controls to the console.
         """
         print("Keyboard controls:", self._inputs[0][0], "\n")
-        print("Gamepad controls:", self._inputs[0][0], "\n")
+        print("Gamepad controls:", self._inputs[0][1], "\n")
 
 
 class PlayerInput:
@@ -90,7 +90,7 @@ class EventHandler:
             self.buttons[button] = PlayerInput(button)
 
     def __repr__(self):
-        print(self.event_map)
+        return repr(self.event_map)
 
     def process_event(self, event):
         """
@@ -159,7 +159,7 @@ class GamepadInput(EventHandler):
         self.init_all_joysticks()
 
     def __repr__(self):
-        print(GamepadInput.default_input_map)
+        return repr(GamepadInput.default_input_map)
 
     @staticmethod
     def init_all_joysticks():
@@ -9,7 +9,7 @@ import pytmx
 
 import pygame.mixer
 from pygame import Rect
-from pygame.sprite import LayeredUpdates
+from pygame.sprite import LayeredDirty
 
 from stuntcat import resources
 from stuntcat.scenes.scene import Scene
@@ -40,19 +40,40 @@ CONTROL = (
 class PlatformerScene(Scene):
     """
     Platformer Scene class.
+
+    Physics steps a fixed STEP seconds at a time, however long frames take,
+    so it plays the same at any frame rate. Sprites are drawn in between
+    the last two steps, by how much of a step is left over.
     """
 
-    def __init__(self, game):
+    # Seconds of physics each space.step does. The cat's springs are stiff,
+    # so bigger steps trade stability for less CPU per frame.
+    STEP = 1 / 900.0
+    # Most steps a tick catches up with. Time past that is dropped, so a
+    # slow frame slows the game rather than making the next frame slower.
+    MAX_STEPS = 90
+
+    def __init__(self, game, step=None, max_steps=None):
+        """
+        :param game: The game the scene is in.
+        :param step: Seconds of physics a step, STEP by default.
+        :param max_steps: Most steps a tick, MAX_STEPS by default.
+        """
         super().__init__(game)
+        self.step = self.STEP if step is None else step
+        self.max_steps = self.MAX_STEPS if max_steps is None else max_steps
+        # Seconds of frame time the physics hasn't stepped through yet.
+        self.accumulator = 0.0
         self.player = None
         self.active = True
         self.fsm = None
         self.space = pymunk.Space()
         self.space.gravity = (0, 1000)
-        self.sprites = LayeredUpdates()
+        self.sprites = LayeredDirty()
         self.event_handler = event_handling.EventQueueHandler()
         self.event_handler.print_controls()
         self.background = resources.gfx("background.png", convert=True)
+        self.first_render = True
         self.load()
         pygame.mixer.music.load(resources.music_path("zirkus.ogg"))
         pygame.mixer.music.play(-1)
@@ -129,18 +150,39 @@ class PlatformerScene(Scene):
 
         """
         surface = self._game.screen
-        surface.blit(self.background, (0, 0))
-        self.sprites.draw(surface)
-        return [surface.get_rect()]
+        if self.first_render:
+            # After this only the areas sprites move from and to are drawn.
+            self.first_render = False
+            surface.blit(self.background, (0, 0))
+            self.sprites.clear(surface, self.background)
+            self.sprites.draw(surface)
+            # That draw was a full one, which leaves the sprites dirty.
+            for asprite in self.sprites:
+                if asprite.dirty == 1:
+                    asprite.dirty = 0
+            return [surface.get_rect()]
+        return self.sprites.draw(surface)
 
     def tick(self, time_delta):
         """
         Tick the physics and game update loops.
+
+        :param time_delta: The time delta in ms.
         """
-        step_amount = (1 / 30.0) / 30
-        for _ in range(30):
-            self.space.step(step_amount)
-        self.sprites.update(time_delta=time_delta)
+        self.accumulator = min(
+            self.accumulator + time_delta / 1000.0, self.step * self.max_steps
+        )
+        # A little slack, so 1/30 of a second is 30 steps of 1/900, not 29.
+        steps = int(self.accumulator / self.step + 1e-6)
+        for i in range(steps):
+            if i == steps - 1:
+                for asprite in self.sprites:
+                    asprite.save_position()
+            self.space.step(self.step)
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.sprites.update(
+            time_delta=time_delta, alpha=self.accumulator / self.step
+        )
 
     def event(self, event):
         """
@@ -14,6 +14,35 @@ from stuntcat import resources
 BALL_MASS = 1
 
 
+def _rotozoom(image, angle):
+    """Rotate image smoothly, without scaling it."""
+    return rotozoom(image, angle, 1)
+
+
+# Rotations of every ShapeSprite image to whole degrees. Sprites made from
+# the same image share them, like the balls. The wheel, the balls and the
+# cat parts spin all the way round, about 44 MB for the four images.
+ROTATIONS = resources.RotationCache(max_bytes=48 * 1024 * 1024, rotate=_rotozoom)
+
+# (id(image), size) -> (image, scaled image), so sprites of the same size
+# made from the same image get the same surface, and share rotations.
+_SCALED = resources.ResourceCache(
+    4 * 1024 * 1024, lambda value: resources.surface_bytes(value[1])
+)
+
+
+def _scaled(image, size):
+    """
+    :return: image smoothscaled to size, the same surface while it's cached.
+    """
+    key = (id(image), size)
+    scaled = _SCALED.get(key)
+    if scaled is None:
+        scaled = (image, smoothscale(image, size))
+        _SCALED.put(key, scaled)
+    return scaled[1]
+
+
 class ShapeSprite(DirtySprite):
     """
     Shape sprite class.
@@ -24,6 +53,8 @@ class ShapeSprite(DirtySprite):
         self.original_image = image
         self.shape = shape
         self._old_angle = None
+        # (position, angle) of the body before the last physics step.
+        self._previous = None
         self.image = None
         self.rect = None
         if shape and image:
@@ -32,24 +63,50 @@ class ShapeSprite(DirtySprite):
                 int((bounding_box.right - bounding_box.left) * factor),
                 int((bounding_box.top - bounding_box.bottom) * factor),
             )
-            self.original_image = smoothscale(image, size)
+            self.original_image = _scaled(image, size)
+
+    def save_position(self):
+        """
+        Remember where the body is, before the last physics step of a tick.
+        """
+        body = self.shape.body
+        self._previous = (body.position, body.angle)
+
+    def _interpolated(self, alpha):
+        """
+        :param alpha: How far from the last step to the next one to draw at.
+        :return: (center, angle in radians) to draw the sprite at.
+        """
+        body = self.shape.body
+        center = self.shape.bb.center()
+        if self._previous is None or alpha >= 1.0:
+            return center, body.angle
+        previous_position, previous_angle = self._previous
+        # Drawn up to a step behind the physics, but moving smoothly.
+        center = center + (previous_position - body.position) * (1.0 - alpha)
+        return center, previous_angle + (body.angle - previous_angle) * alpha
 
     def update(self, *args, **kwargs):
         """
         Update the shape sprite.
 
+        :param alpha: How far between the last two physics steps to draw.
         """
         if hasattr(self.shape, "needs_remove"):
             self.kill()
         else:
-            angle = round(degrees(self.shape.body.angle), 0)
+            center, angle = self._interpolated(kwargs.get("alpha", 1.0))
+            angle = round(degrees(angle), 0)
             if angle != self._old_angle:
-                self.image = rotozoom(self.original_image, -angle, 1)
+                self.image = ROTATIONS.get(self.original_image, -angle)
                 self.rect = self.image.get_rect()
                 self._old_angle = angle
                 self.dirty = 1
 
-            self.rect.center = self.shape.bb.center()
+            old_center = self.rect.center
+            self.rect.center = center
+            if self.rect.center != old_center:
+                self.dirty = 1
 
 
 class Ball(ShapeSprite):
@@ -1,12 +1,29 @@
 """A cat riding a unicycle.
 """
 
+import functools
 import math
 
 import pygame
 from pygame.sprite import DirtySprite
 
-from stuntcat.resources import gfx, sfx
+from stuntcat.resources import gfx, sfx, RotationCache
+
+# Cat frames rotated to whole degrees, shared by every Cat. Most rotations
+# are about 160x190 pixels, so this keeps a few hundred of them. That is
+# the angles a cat leans to in play, see benchmarks/bench_rotation.py.
+ROTATIONS = RotationCache(max_bytes=64 * 1024 * 1024)
+
+
+@functools.lru_cache(maxsize=None)
+def _frame(number, flipped):
+    """
+    :param number: Of the animation frame, from 1.
+    :param flipped: Facing left instead of right.
+    :return: The frame, the same surface for every Cat so they share rotations.
+    """
+    image = gfx("cat_unicycle%d.png" % number, convert_alpha=True)
+    return pygame.transform.flip(image, True, False) if flipped else image
 
 
 class AnimatedCat(DirtySprite):
@@ -42,6 +59,20 @@ class AnimatedCat(DirtySprite):
 
         return changed
 
+    def snapshot(self):
+        """
+        :return: The animation state as a tuple, for restore.
+        """
+        return self.frame, self.frame_time, self.frame_direction
+
+    def restore(self, snapshot):
+        """
+        Put the animation back how it was when snapshot was taken.
+
+        :param snapshot: A tuple from snapshot.
+        """
+        self.frame, self.frame_time, self.frame_direction = snapshot
+
     def animate(self, time_delta):
         """Animate the sprite."""
         self.frame_time += time_delta
@@ -65,13 +96,8 @@ class Cat(AnimatedCat):
         self.rect = self.image.get_rect()
         sfx("cat_jump.ogg")
 
-        self.images = []
-        self.flipped_images = []
-
-        for i in range(self.num_frames):
-            img = gfx("cat_unicycle%d.png" % (i + 1), convert_alpha=True)
-            self.images.append(img)
-            self.flipped_images.append(pygame.transform.flip(img, 1, 0))
+        self.images = [_frame(i + 1, False) for i in range(self.num_frames)]
+        self.flipped_images = [_frame(i + 1, True) for i in range(self.num_frames)]
 
     def get_image(self):
         """Return the image for the animated frame"""
@@ -89,7 +115,7 @@ class Cat(AnimatedCat):
             self.image = self.get_image()
 
         if self.changed(location[:], direction, rotation, self.frame):
-            self.image = pygame.transform.rotate(
+            self.image = ROTATIONS.get(
                 self.get_image(), -self.cat_holder.player_data.cat_angle * 180 / math.pi
             )
             size = self.image.get_rect().size
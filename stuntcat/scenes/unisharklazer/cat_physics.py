@@ -0,0 +1,198 @@
+"""
+Cat physics for a whole population of cats at once.
+
+The same physics as CatUniScene.tick, _move_cat, _cat_out_of_bounds and
+_cat_jumping, but with every cat's state held in numpy arrays so that
+thousands of cats advance in one call. Only the cat itself is simulated,
+not the fish, shark or elephant.
+
+::Example::
+
+    >>> cats = CatPhysicsBatch(1000)
+    >>> right = np.ones(1000, dtype=bool)
+    >>> left = np.zeros(1000, dtype=bool)
+    >>> crashed, splashed, bumped = cats.step(33.3, left, right)
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
+
+from stuntcat.scenes.unisharklazer import (
+    PlayerData,
+    CAT_MAX_JUMPING_TIME,
+    CAT_JUMP_SPEED,
+    CAT_JUMP_IMPULSE,
+)
+
+
+class CatPhysicsBatch:  # pylint:disable=too-many-instance-attributes
+    """
+    Struct of arrays holding the state of many unicycle cats.
+    """
+
+    def __init__(self, num_cats, width=1920 // 2, height=1080 // 2):
+        """
+        :param num_cats: How many cats to simulate.
+        :param width: Width of the scene, like CatUniScene.width.
+        :param height: Height of the scene, like CatUniScene.height.
+        """
+        player_data = PlayerData(width, height)
+        self.num_cats = num_cats
+        self.width, self.height = width, height
+        self.cat_wire_height = player_data.cat_wire_height
+        self.cat_start_pos = player_data.cat_start_pos[:]
+        self.cat_speed_max = player_data.cat_speed_max
+        self.cat_fall_speed_max = player_data.cat_fall_speed_max
+        self.cat_roll_speed = player_data.cat_roll_speed
+
+        self.location = np.empty((num_cats, 2))
+        self.speed = np.empty((num_cats, 2))
+        self.angle = np.empty(num_cats)
+        self.angular_vel = np.empty(num_cats)
+        self.head_location = np.empty((num_cats, 2), dtype=np.int64)
+        self.touching_ground = np.empty(num_cats, dtype=bool)
+        self.jumping = np.empty(num_cats, dtype=bool)
+        self.jumping_time = np.empty(num_cats)
+        self.reset()
+
+    def reset(self, mask=None):
+        """
+        Put cats back at the start, like PlayerData.reset.
+
+        :param mask: bool array of the cats to reset, or None for all of them.
+        """
+        if mask is None:
+            mask = np.ones(self.num_cats, dtype=bool)
+            self.touching_ground[:] = True
+            self.jumping[:] = False
+            self.jumping_time[:] = 0
+        self.location[mask] = self.cat_start_pos
+        self.speed[mask] = 0
+        self.angle[mask] = 0
+        self.angular_vel[mask] = 0
+        self._update_head_location()
+
+    def start_jump(self, mask):
+        """
+        Start jumping, for the cats in mask that are on the ground.
+
+        :param mask: bool array of the cats pressing jump.
+        """
+        start = mask & self.touching_ground & ~self.jumping
+        self.jumping |= start
+        self.jumping_time[start] = 0
+        self.speed[start, 1] -= CAT_JUMP_IMPULSE
+
+    def stop_jump(self, mask):
+        """
+        Stop jumping, for the cats in mask.
+
+        :param mask: bool array of the cats releasing jump.
+        """
+        self.jumping &= ~mask
+
+    def step(self, time_delta, left, right):
+        """
+        Advance every cat by time_delta ms.
+
+        Cats that die are reset, like CatUniScene.reset_on_death does.
+
+        :param time_delta: The time delta in ms.
+        :param left: bool array of cats holding left.
+        :param right: bool array of cats holding right.
+        :return: bool arrays (crashed, splashed, bumped) for the cats that
+            fell over, fell in the pool, or were bumped back from the edge.
+        """
+        dt_scaled = time_delta / 17
+        speed = self.speed
+
+        self.angular_vel *= 0.9 ** dt_scaled
+        speed[:, 0] += np.sin(self.angle) * (dt_scaled * self.cat_roll_speed)
+        np.minimum(
+            speed[:, 1] + (1 * dt_scaled), self.cat_fall_speed_max, out=speed[:, 1]
+        )
+
+        crashed = self._move_cats(dt_scaled, left, right)
+        splashed, bumped = self._cats_out_of_bounds(dt_scaled)
+        self._cats_jumping(time_delta)
+        return crashed, splashed, bumped
+
+    def _move_cats(self, dt_scaled, left, right):
+        """Move, accelerate, and tilt the cats."""
+        location, speed = self.location, self.speed
+
+        speed[right, 0] = np.minimum(
+            speed[right, 0] + 0.3 * dt_scaled, self.cat_speed_max
+        )
+        self.angle[right] -= 0.003 * dt_scaled
+        speed[left, 0] = np.maximum(
+            speed[left, 0] - 0.3 * dt_scaled, -self.cat_speed_max
+        )
+        self.angle[left] += 0.003 * dt_scaled
+
+        # make the cats fall
+        angle_sign = np.where(self.angle > 0, 1, -1)
+        self.angular_vel += 0.0002 * angle_sign * dt_scaled
+        self.angle += self.angular_vel * dt_scaled
+        crashed = (np.abs(self.angle) > math.pi / 2) & (
+            location[:, 1] > self.height - 160
+        )
+        if crashed.any():
+            self.reset(crashed)
+
+        location += speed * dt_scaled
+        self.touching_ground = (location[:, 1] > self.cat_wire_height) & (
+            location[:, 0] > 0.25 * self.width
+        )
+        location[self.touching_ground, 1] = self.cat_wire_height
+        speed[self.touching_ground, 1] = 0
+        return crashed
+
+    def _cats_out_of_bounds(self, dt_scaled):
+        """Check for cats out of bounds."""
+        location, speed = self.location, self.speed
+
+        # in the pool
+        splashed = location[:, 1] > self.height
+        if splashed.any():
+            self.reset(splashed)
+
+        # to the right of screen.
+        past_right = location[:, 0] > self.width
+        location[past_right, 0] = self.width
+        self.angle[past_right & (self.angle > 0)] *= 0.7
+
+        self._update_head_location()
+
+        # bump the cats back in
+        bumped = (location[:, 0] > 0.98 * self.width) & (
+            location[:, 1] > self.cat_wire_height - 30
+        )
+        self.angular_vel[bumped] -= 0.01 * dt_scaled
+        speed[bumped] = (-5, -20)
+        return splashed, bumped
+
+    def _cats_jumping(self, time_delta):
+        """Jumping physics."""
+        jumping = self.jumping
+        self.speed[jumping, 1] -= (
+            time_delta
+            * ((CAT_MAX_JUMPING_TIME - self.jumping_time[jumping]) / CAT_MAX_JUMPING_TIME)
+            * CAT_JUMP_SPEED
+        )
+        self.jumping_time[jumping] += time_delta
+        self.jumping &= self.jumping_time < CAT_MAX_JUMPING_TIME
+
+    def _update_head_location(self):
+        """Where the cats' heads are, truncated to ints like the scalar path."""
+        self.head_location[:, 0] = np.trunc(
+            self.location[:, 0] + 100 * np.cos(self.angle - math.pi / 2)
+        )
+        self.head_location[:, 1] = np.trunc(
+            self.location[:, 1] + 100 * np.sin(self.angle - math.pi / 2)
+        )
@@ -36,6 +36,30 @@ class ElephantAnimation:
         self.last_animation = 0  # ms
         self.just_happened = None
 
+    def snapshot(self):
+        """
+        :return: The animation state as a tuple, for restore.
+        """
+        return (
+            self.current_state,
+            self.last_state,
+            self.last_animation,
+            self.just_happened,
+        )
+
+    def restore(self, snapshot):
+        """
+        Put the animation back how it was when snapshot was taken.
+
+        :param snapshot: A tuple from snapshot.
+        """
+        (
+            self.current_state,
+            self.last_state,
+            self.last_animation,
+            self.just_happened,
+        ) = snapshot
+
     def update(self, total_time):
         """
         Update the animation.
@@ -99,6 +123,22 @@ class Elephant(DirtySprite):
         self.rect.x = -1000
         self.rect.y = -1000
 
+    def snapshot(self):
+        """
+        :return: The elephant's animation and position as a tuple, for restore.
+        """
+        return self.animation.snapshot(), self.rect.x, self.rect.y
+
+    def restore(self, snapshot):
+        """
+        Put the elephant back how it was when snapshot was taken.
+
+        :param snapshot: A tuple from snapshot.
+        """
+        animation, self.rect.x, self.rect.y = snapshot
+        self.animation.restore(animation)
+        self.dirty = 1
+
     def animate(self, total_time):
         """
         Animate the elephant
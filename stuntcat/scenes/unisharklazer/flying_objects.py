@@ -1,13 +1,172 @@
 """
 Fish module
 """
-import math
 import random
+from typing import Optional
 
-from pygame.sprite import DirtySprite
-from pygame.math import Vector2
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError(  # pylint:disable=raise-missing-from
+        "Cannot import numpy, install it with: pip install numpy"
+    )
 
-from stuntcat.resources import gfx, sfx, distance
+from pygame.sprite import DirtySprite, LayeredDirty
+
+from stuntcat.resources import gfx
+
+# The flying object images are drawn this far up and left of their pos.
+IMAGE_OFFSET = 25
+GRAVITY = 0.2
+
+# Flying objects used to be moved twice a frame, by 0.25 of the scaled
+# time delta in tick and by all of it again in update. Moving them once
+# by the sum keeps the throws looking the same.
+TIME_SCALE = 1.25
+
+
+class LayeredDirtyAppend(LayeredDirty):
+    """Like a group, except it has append and extend methods like a list."""
+
+    def append(self, sprite):
+        """
+        Append an item to the sprite group.
+
+        :param sprite: the sprite.
+        """
+        self.add(sprite)
+
+    def extend(self, sprite_list):
+        """
+        Extend the sprite group with a list of items.
+
+        :param sprite_list: the list.
+        """
+        for sprite in sprite_list:
+            self.add(sprite)
+
+
+class FlyingObjectGroup(LayeredDirtyAppend):
+    """
+    A group of flying objects with their positions and velocities in arrays.
+
+    While a FlyingObject is in one of these groups its pos and velocity
+    are rows of the group's arrays, so the group can move and collide all
+    of them at once with numpy.
+    """
+
+    def __init__(self, *sprites, **kwargs):
+        self._positions = np.zeros((8, 2))
+        self._velocities = np.zeros((8, 2))
+        self._rows = []  # the sprite for each row of the arrays.
+        LayeredDirtyAppend.__init__(self, *sprites, **kwargs)
+
+    @property
+    def positions(self):
+        """
+        The positions of the flying objects, one row per object.
+        """
+        return self._positions[: len(self._rows)]
+
+    @property
+    def velocities(self):
+        """
+        The velocities of the flying objects, one row per object.
+        """
+        return self._velocities[: len(self._rows)]
+
+    def add_internal(self, sprite, layer=None):
+        LayeredDirtyAppend.add_internal(self, sprite, layer)
+        if getattr(sprite, "arrays_group", False) is not None:
+            # Not a flying object, or its pos lives in another group already.
+            return
+        row = len(self._rows)
+        if row == len(self._positions):
+            self._positions = np.resize(self._positions, (row * 2, 2))
+            self._velocities = np.resize(self._velocities, (row * 2, 2))
+        self._positions[row] = sprite.pos
+        self._velocities[row] = sprite.velocity
+        self._rows.append(sprite)
+        sprite.arrays_group = self
+        sprite.arrays_row = row
+
+    def remove_internal(self, sprite):
+        LayeredDirtyAppend.remove_internal(self, sprite)
+        if getattr(sprite, "arrays_group", None) is not self:
+            return
+        row = sprite.arrays_row
+        sprite.arrays_group = None
+        sprite.pos = list(self._positions[row])
+        sprite.velocity = list(self._velocities[row])
+
+        # move the last row into the hole left by this one.
+        last = len(self._rows) - 1
+        if row != last:
+            moved = self._rows[last]
+            self._positions[row] = self._positions[last]
+            self._velocities[row] = self._velocities[last]
+            self._rows[row] = moved
+            moved.arrays_row = row
+        self._rows.pop()
+
+    def integrate(self, dt_scaled, height):
+        """
+        Move every flying object, and kill the ones that fell off the screen.
+
+        :param dt_scaled: The scaled time delta.
+        :param height: The screen height.
+        """
+        positions, velocities = self.positions, self.velocities
+        positions[:, 0] += velocities[:, 0] * dt_scaled  # speed of the throw
+        velocities[:, 1] += GRAVITY * dt_scaled  # gravity
+        positions[:, 1] += velocities[:, 1] * dt_scaled  # y velocity
+        # check out of bounds
+        for row in np.flatnonzero(positions[:, 1] > height)[::-1]:
+            self._rows[row].kill()
+
+    def snapshot(self):
+        """
+        :return: The kinds, positions and velocities of the flying objects.
+        """
+        return (
+            tuple(sprite.kind for sprite in self._rows),
+            self.positions.copy(),
+            self.velocities.copy(),
+        )
+
+    def restore(self, snapshot, make_sprite):
+        """
+        Put the flying objects back how they were when snapshot was taken.
+
+        The sprites already in the group are reused where possible.
+
+        :param snapshot: A tuple from snapshot.
+        :param make_sprite: make_sprite(kind) -> a new flying object.
+        """
+        kinds, positions, velocities = snapshot
+        # killing from the end means no rows get moved.
+        for sprite in self._rows[len(kinds) :][::-1]:
+            sprite.kill()
+        for row, kind in enumerate(kinds):
+            if row < len(self._rows):
+                self._rows[row].set_kind(kind)
+            else:
+                self.add(make_sprite(kind))
+        self.positions[:] = positions
+        self.velocities[:] = velocities
+
+    def collide(self, point, radius):
+        """
+        Find the flying objects whose image corner is within radius of point.
+
+        :param point: The (x, y) to test against, like the cat head location.
+        :param radius: The collision distance.
+        :return: list of (sprite, (x, y)) with the corner of each hit image.
+        """
+        corners = self.positions - IMAGE_OFFSET
+        offsets = corners - point
+        hits = np.flatnonzero(np.einsum("ij,ij->i", offsets, offsets) < radius * radius)
+        return [(self._rows[row], tuple(corners[row])) for row in hits]
 
 
 class FlyingObject(DirtySprite):
@@ -15,32 +174,70 @@ class FlyingObject(DirtySprite):
     Flying Object class for things that are tossed to the cat.
     """
 
+    kind = None  # type: Optional[str]
+
     def __init__(self, group, pos, vel, image):
-        DirtySprite.__init__(self, group)
+        DirtySprite.__init__(self)
         self.image = image
         self.rect = self.image.get_rect()
         self.rect.topleft = pos
-        self.velocity = Vector2(vel)
 
-        self.last_pos = [self.rect.x, self.rect.y]
-        self.pos = [self.rect.x, self.rect.y]
+        self.arrays_group = None  # type: Optional[FlyingObjectGroup]
+        self.arrays_row = 0
+        self._pos = [self.rect.x, self.rect.y]
+        self._velocity = list(vel)
+        self.last_pos = (self.rect.x, self.rect.y)
+        self.add(group)
 
-    def update(self, *args, **kwargs):
-        if self.last_pos != self.pos[:2]:
-            self.dirty = True
-            self.rect.x = self.pos[0] - 25
-            self.rect.y = self.pos[1] - 25
-        self.last_pos = self.pos[:2]
+    @property
+    def pos(self):
+        """
+        The position, a row of the group's positions when in a FlyingObjectGroup.
+        """
+        if self.arrays_group is None:
+            return self._pos
+        return self.arrays_group.positions[self.arrays_row]
 
-        dt_scaled = kwargs["time_delta"]
-        height = kwargs["height"]
+    @pos.setter
+    def pos(self, value):
+        if self.arrays_group is None:
+            self._pos = value
+        else:
+            self.arrays_group.positions[self.arrays_row] = value
 
-        self.pos[0] += self.velocity[0] * dt_scaled  # speed of the throw
-        self.velocity[1] += 0.2 * dt_scaled  # gravity
-        self.pos[1] += self.velocity[1] * dt_scaled  # y velocity
-        # check out of bounds
-        if self.pos[1] > height:
-            self.kill()
+    @property
+    def velocity(self):
+        """
+        The velocity, a row of the group's velocities when in a FlyingObjectGroup.
+        """
+        if self.arrays_group is None:
+            return self._velocity
+        return self.arrays_group.velocities[self.arrays_row]
+
+    @velocity.setter
+    def velocity(self, value):
+        if self.arrays_group is None:
+            self._velocity = value
+        else:
+            self.arrays_group.velocities[self.arrays_row] = value
+
+    def set_kind(self, kind):
+        """
+        Change what kind of flying object this is, see make_flying_object.
+
+        :param kind: The kind to change to.
+        """
+
+    def update(self, *args, **kwargs):
+        """
+        Move the rect to pos for drawing. The physics happens in the group.
+        """
+        pos = (self.pos[0], self.pos[1])
+        if self.last_pos != pos:
+            self.dirty = True
+            self.rect.x = pos[0] - IMAGE_OFFSET
+            self.rect.y = pos[1] - IMAGE_OFFSET
+        self.last_pos = pos
 
 
 class Fish(FlyingObject):
@@ -50,22 +247,28 @@ class Fish(FlyingObject):
 
     colors = ["red", "yellow", "green"]
 
-    def __init__(self, group, pos, vel):
-        image = gfx("fish_" + random.choice(Fish.colors) + ".png", convert_alpha=True)
-        FlyingObject.__init__(self, group, pos, vel, image)
+    def __init__(self, group, pos, vel, color=None):
+        """
+        :param color: One of colors, a random one by default.
+        """
+        if color is None:
+            color = random.choice(Fish.colors)
+        self.kind = color
+        FlyingObject.__init__(self, group, pos, vel, Fish.color_image(color))
 
-    def update(self, *args, **kwargs):
-        FlyingObject.update(self, *args, **kwargs)
+    @staticmethod
+    def color_image(color):
+        """
+        :param color: One of colors.
+        :return: The image for a fish of that color.
+        """
+        return gfx("fish_" + color + ".png", convert_alpha=True)
 
-        if (
-            distance(
-                [self.rect[0], self.rect[1]], kwargs["player_data"].cat_head_location
-            )
-            < 100
-        ):
-            kwargs["player_data"].increment_score()
-            self.kill()
-            sfx("eatfish.ogg", play=1)
+    def set_kind(self, kind):
+        if kind != self.kind:
+            self.kind = kind
+            self.image = Fish.color_image(kind)
+            self.dirty = 1
 
 
 class NotFish(FlyingObject):
@@ -73,26 +276,20 @@ class NotFish(FlyingObject):
     Not-fish sprite class.
     """
 
+    kind = "ring"
+
     def __init__(self, group, pos, vel):
         image = gfx("ring.png", convert_alpha=True)
         FlyingObject.__init__(self, group, pos, vel, image)
 
-    def update(self, *args, **kwargs):
-        FlyingObject.update(self, *args, **kwargs)
-
-        if (
-            distance(
-                [self.rect[0], self.rect[1]], kwargs["player_data"].cat_head_location
-            )
-            < 50
-        ):
-            self.kill()
-            kwargs["player_data"].angle_to_not_fish = (
-                math.atan2(
-                    kwargs["player_data"].cat_head_location[1] - self.rect[1],
-                    kwargs["player_data"].cat_head_location[0] - self.rect[0],
-                )
-                - math.pi / 2
-            )
-            side = 1 if kwargs["player_data"].angle_to_not_fish < 0 else -1
-            kwargs["player_data"].cat_angular_vel += side * random.uniform(0.08, 0.15)
+
+def make_flying_object(kind, group):
+    """
+    Make a flying object of a kind.
+
+    :param kind: "ring" for a NotFish, or a Fish color.
+    :param group: Group for the sprite, like the scene's allsprites.
+    """
+    if kind == NotFish.kind:
+        return NotFish(group, (0, 0), (0, 0))
+    return Fish(group, (0, 0), (0, 0), color=kind)
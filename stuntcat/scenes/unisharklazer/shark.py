@@ -207,6 +207,46 @@ class Shark(DirtySprite):  # pylint:disable=too-many-instance-attributes
 
         self.last_state = start_state
 
+    def snapshot(self):
+        """
+        :return: The shark's state machine and position as a tuple, for restore.
+        """
+        return (
+            self.state,
+            self.last_state,
+            self.just_happened,
+            self.lazered,
+            self.applaud,
+            self.last_animation,
+            self.rect.x,
+            self.rect.y,
+            self.lazer is not None,
+        )
+
+    def restore(self, snapshot):
+        """
+        Put the shark back how it was when snapshot was taken.
+
+        :param snapshot: A tuple from snapshot.
+        """
+        (
+            self.state,
+            self.last_state,
+            self.just_happened,
+            self.lazered,
+            self.applaud,
+            self.last_animation,
+            self.rect.x,
+            self.rect.y,
+            has_lazer,
+        ) = snapshot
+        self.dirty = True
+        if has_lazer and self.lazer is None:
+            self.lazer = Lazer(self.container, (self.width, self.height))
+        elif not has_lazer and self.lazer is not None:
+            self.lazer.kill()
+            self.lazer = None
+
     def set_state(self, new_state):
         """set the state number from the name """
         self.state = list(self.states.values()).index(new_state)
@@ -0,0 +1,154 @@
+""" Text drawn from glyph atlases.
+
+Each glyph of a font, size and color is rendered once into an atlas
+surface. Strings are composed from it with Surface.blits, and the
+most recently used strings are kept.
+
+::Example::
+
+    >>> score_text = atlas("monospace", 30, (0, 0, 0), bold=True)
+    >>> image = score_text.render("123")
+"""
+from collections import OrderedDict
+
+import pygame
+
+_FONTS = {}
+_ATLASES = {}
+
+
+def font(name, size, bold=False, italic=False):
+    """
+    A system font, looked up and loaded only once.
+
+    :param name: Font name, as for pygame.font.SysFont.
+    :param size: Size in points.
+    :param bold:
+    :param italic:
+    :return: The pygame.font.Font.
+    """
+    font_key = (name, size, bold, italic)
+    if font_key not in _FONTS:
+        _FONTS[font_key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return _FONTS[font_key]
+
+
+# pylint:disable=too-many-arguments
+def atlas(name, size, color, bold=False, italic=False, antialias=True):
+    """
+    The shared GlyphAtlas for a system font in a color.
+
+    :param name: Font name, as for pygame.font.SysFont.
+    :param size: Size in points.
+    :param color: Text color.
+    :param bold:
+    :param italic:
+    :param antialias:
+    :return: The GlyphAtlas.
+    """
+    atlas_key = (name, size, tuple(color), bold, italic, antialias)
+    if atlas_key not in _ATLASES:
+        _ATLASES[atlas_key] = GlyphAtlas(
+            font(name, size, bold, italic), color, antialias
+        )
+    return _ATLASES[atlas_key]
+
+
+class GlyphAtlas:
+    """
+    Glyphs of one font and color, in a single surface.
+
+    Each glyph is placed as far after the one before as Font.size says
+    the pair of them is wider than the one before alone, which takes in
+    kerning. Strings come out the same size as with Font.render, and the
+    same for monospace fonts like the HUD uses. Other fonts can be a
+    pixel out.
+    """
+
+    def __init__(self, afont, color, antialias=True, max_strings=256):
+        """
+        :param afont: The pygame.font.Font to render glyphs with.
+        :param color: Text color.
+        :param antialias:
+        :param max_strings: How many rendered strings to keep.
+        """
+        self.font = afont
+        self.color = color
+        self.antialias = antialias
+        self.max_strings = max_strings
+        self.height = afont.get_height()
+        self.surface = pygame.Surface((0, self.height), pygame.SRCALPHA)
+        self._glyphs = {}  # char -> area of self.surface.
+        self._steps = {}  # (char before, char) -> how far right char goes.
+        self._strings = OrderedDict()  # text -> surface.
+
+    def glyph(self, char):
+        """
+        :param char: A single character.
+        :return: The area of self.surface holding char, added if missing.
+        """
+        area = self._glyphs.get(char)
+        if area is None:
+            image = self.font.render(char, self.antialias, self.color)
+            width = self.surface.get_width()
+            grown = pygame.Surface(
+                (width + image.get_width(), self.height), pygame.SRCALPHA
+            )
+            grown.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            grown.blit(image, (width, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.surface = grown
+            area = self._glyphs[char] = pygame.Rect(
+                width, 0, image.get_width(), self.height
+            )
+        return area
+
+    def step(self, before, char):
+        """
+        :param before: The character before char, or "" at the start.
+        :param char: A single character.
+        :return: How many pixels the text grows by when char is added after before.
+        """
+        pair = (before, char)
+        step = self._steps.get(pair)
+        if step is None:
+            step = self._steps[pair] = (
+                self.font.size(before + char)[0] - self.font.size(before)[0]
+            )
+        return step
+
+    def size(self, text):
+        """
+        :param text: The string.
+        :return: (width, height) text renders at.
+        """
+        return self.font.size(text)
+
+    def render(self, text):
+        """
+        :param text: The string.
+        :return: A surface with text on a transparent background. It is
+            shared with later calls, so don't draw on it.
+        """
+        surface = self._strings.get(text)
+        if surface is not None:
+            self._strings.move_to_end(text)
+            return surface
+
+        # Add any new glyphs first, as that replaces self.surface.
+        areas = [self.glyph(char) for char in text]
+        surface = pygame.Surface(self.font.size(text), pygame.SRCALPHA)
+        blits = []
+        x = 0
+        before = ""
+        for char, area in zip(text, areas):
+            blits.append((self.surface, (x, 0), area, pygame.BLEND_RGBA_MAX))
+            x += self.step(before, char)
+            before = char
+        # Taking the max over the clear surface copies glyphs exactly,
+        # rather than blending their edges with it.
+        surface.blits(blits, doreturn=False)
+
+        self._strings[text] = surface
+        if len(self._strings) > self.max_strings:
+            self._strings.popitem(last=False)
+        return surface
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+# Run without a window or sound card, like tox does.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture(scope='session')
+def pg():
+    """ This initialises pygame and quits it once per session.
+
+    Also returns pygame so it can be used as a fixture.
+    """
+    import pygame
+    # setup.
+    pygame.init()
+    yield pygame
+    # teardown
+    pygame.quit()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def cache_dir(tmp_path_factory):
+    """ Keep decoded sounds out of the user's cache.
+    """
+    os.environ["STUNTCAT_CACHE_DIR"] = str(tmp_path_factory.mktemp("cache"))
+
+
+@pytest.fixture
+def play_session():
+    """ Play some frames of a game, pressing keys and with uneven time deltas.
+
+    Returns a function of (game, frames).
+    """
+    import pygame
+
+    def play(game, frames):
+        keys = [pygame.K_RIGHT, pygame.K_a, pygame.K_UP, pygame.K_LEFT, pygame.K_d]
+        for frame in range(frames):
+            if frame % 7 == 0:
+                key = keys[frame // 7 % len(keys)]
+                event_type = pygame.KEYDOWN if frame % 14 == 0 else pygame.KEYUP
+                pygame.event.post(pygame.event.Event(event_type, key=key))
+            game.step(1000.0 / 30 + (frame * 7919 % 13) / 3.0)
+
+    return play
@@ -0,0 +1,37 @@
+"""Tests for the image bundle."""
+import os
+import shutil
+
+import pygame
+
+from stuntcat import bundle
+from stuntcat.resources import data_path
+
+
+def test_bundle_matches_png(pg, tmp_path):  # pylint:disable=unused-argument
+    """bundled pixels are the decoded png's, and changed images are left out."""
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    for name in ("fish.png", "ring.png"):
+        shutil.copy(os.path.join(data_path(), "images", name), str(images_dir / name))
+    path = str(tmp_path / bundle.FILENAME)
+    assert bundle.build(str(images_dir), path) == 2
+
+    image_bundle = bundle.load(str(images_dir))
+    png = pygame.image.load(str(images_dir / "fish.png"))
+    assert pygame.image.tobytes(image_bundle.image("fish.png"), "RGBA") == (
+        pygame.image.tobytes(png, "RGBA")
+    )
+
+    # Only what is in a file counts, not when it was written, as installs
+    # don't keep file times.
+    os.utime(str(images_dir / "fish.png"), ns=(0, 0))
+    with open(str(images_dir / "ring.png"), "r+b") as afile:
+        afile.seek(-1, os.SEEK_END)
+        last = afile.read(1)
+        afile.seek(-1, os.SEEK_END)
+        afile.write(bytes([last[0] ^ 1]))
+    image_bundle = bundle.load(str(images_dir))
+    assert "fish.png" in image_bundle
+    assert "ring.png" not in image_bundle
+    assert bundle.load(str(tmp_path / "missing" / "images")) is None
@@ -0,0 +1,61 @@
+import pytest
+
+
+def _script(cat_idx, frame):
+    """ Which of left, right, jump each test cat holds on a frame."""
+    phase = (frame // (15 + 7 * cat_idx)) % 4
+    left = phase == 1
+    right = phase in (0, 3) and cat_idx != 2
+    jump = frame % (40 + 11 * cat_idx) < 10
+    return left, right, jump
+
+
+def test_batch_matches_scene(pg):
+    np = pytest.importorskip("numpy")
+    from stuntcat.game import Game
+    from stuntcat.scenes import CatUniScene
+    from stuntcat.scenes.unisharklazer.cat_physics import CatPhysicsBatch
+
+    game = Game(headless=True, render=False)
+    num_cats = 4
+    scenes = [CatUniScene(game) for _ in range(num_cats)]
+    for scene in scenes:
+        # Only the cat is simulated by the batch, so keep things from hitting it.
+        scene._spawn_flying_objects = lambda: None
+        for fish in scene.fish.sprites():
+            fish.kill()
+    cats = CatPhysicsBatch(num_cats)
+
+    keys = (pg.K_LEFT, pg.K_RIGHT, pg.K_UP)
+    held = [(False, False, False)] * num_cats
+    time_delta = 1000.0 / Game.FPS
+    for frame in range(600):
+        wanted = [_script(idx, frame) for idx in range(num_cats)]
+        for idx, scene in enumerate(scenes):
+            for key, was, now in zip(keys, held[idx], wanted[idx]):
+                if was != now:
+                    event_type = pg.KEYDOWN if now else pg.KEYUP
+                    scene.event(pg.event.Event(event_type, key=key))
+            scene.tick(time_delta)
+        jump = np.array([want[2] for want in wanted])
+        was_jump = np.array([was[2] for was in held])
+        cats.start_jump(jump & ~was_jump)
+        cats.stop_jump(~jump & was_jump)
+        cats.step(
+            time_delta,
+            np.array([want[0] for want in wanted]),
+            np.array([want[1] for want in wanted]),
+        )
+        held = wanted
+
+        for idx, scene in enumerate(scenes):
+            player_data = scene.player_data
+            assert cats.location[idx] == pytest.approx(player_data.cat_location)
+            assert cats.speed[idx] == pytest.approx(player_data.cat_speed)
+            assert cats.angle[idx] == pytest.approx(player_data.cat_angle)
+            assert cats.angular_vel[idx] == pytest.approx(player_data.cat_angular_vel)
+            assert cats.jumping[idx] == scene.jumping
+            assert cats.touching_ground[idx] == scene.touching_ground
+
+    # make sure the script made the cats crash, fall and bump too.
+    assert sum(scene.deaths for scene in scenes) > 0
@@ -0,0 +1,56 @@
+import pytest
+
+
+def test_vecenv_step(pg):
+    np = pytest.importorskip("numpy")
+    from stuntcat.env import VecEnv, OBSERVATION_SIZE, NUM_ACTIONS
+
+    envs = VecEnv(3)
+    observations = envs.reset()
+    assert observations.shape == (3, OBSERVATION_SIZE)
+    for step in range(60):
+        actions = [(step + idx) % NUM_ACTIONS for idx in range(3)]
+        observations, rewards, dones = envs.step(actions)
+    assert observations.shape == (3, OBSERVATION_SIZE)
+    assert rewards.shape == dones.shape == (3,)
+    assert np.isfinite(observations).all()
+
+
+def test_vecenv_rewards_and_dones(pg):
+    """eating a fish is rewarded, and a cat dying ends its episode."""
+    pytest.importorskip("numpy")
+    from stuntcat.env import VecEnv, ACTION_NOOP, DEATH_REWARD
+
+    envs = VecEnv(2)
+    envs.reset()
+    eating, dying = envs.scenes
+
+    fish = next(iter(eating.fish))
+    fish.pos[:] = eating.player_data.cat_head_location
+    fish.velocity[:] = 0
+    # In the pool, left of the wire.
+    dying.player_data.cat_location[:] = [0, dying.height + 100]
+
+    observations, rewards, dones = envs.step([ACTION_NOOP, ACTION_NOOP])
+    assert rewards.tolist() == [1.0, DEATH_REWARD]
+    assert dones.tolist() == [False, True]
+    # The dead cat's episode starts again, and its observation is the new one.
+    assert dying.player_data.cat_location[1] < dying.height
+    assert observations[1, 1] == dying.player_data.cat_location[1]
+
+    observations, rewards, dones = envs.step([ACTION_NOOP, ACTION_NOOP])
+    assert not dones.any()
+
+
+def test_vecenv_reset_reuses_scenes(pg):
+    """resets restore the same scenes, rather than making new ones."""
+    pytest.importorskip("numpy")
+    from stuntcat.env import VecEnv, ACTION_RIGHT
+
+    envs = VecEnv(2)
+    first = envs.reset().copy()
+    scenes = list(envs.scenes)
+    for _ in range(30):
+        envs.step([ACTION_RIGHT, ACTION_RIGHT])
+    assert (envs.reset() == first).all()
+    assert envs.scenes == scenes
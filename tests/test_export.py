@@ -0,0 +1,41 @@
+"""Tests for exporting recorded sessions in parallel."""
+import numpy as np
+import pytest
+from PIL import Image
+
+
+def test_chunks_join_seamlessly(pg, tmp_path, play_session):
+    """a gif rendered in chunks by workers is the same as one in one go."""
+    from stuntcat import export
+    from stuntcat.game import Game
+    from stuntcat.replay import Recorder
+
+    path = str(tmp_path / "session.rec")
+    pg.event.clear()
+    game = Game(headless=True, render=False, recorder=Recorder(path, seed=7))
+    play_session(game, 40)
+    game.recorder.close()
+
+    whole_path = str(tmp_path / "whole.gif")
+    chunked_path = str(tmp_path / "chunked.gif")
+    assert export.export(path, whole_path, num_workers=1, chunk_seconds=10) == 40
+    assert export.export(path, chunked_path, num_workers=2, chunk_seconds=0.5) == 40
+
+    whole = Image.open(whole_path)
+    chunked = Image.open(chunked_path)
+    assert whole.n_frames == chunked.n_frames == 40
+    for frame in range(40):
+        whole.seek(frame)
+        chunked.seek(frame)
+        assert whole.info["duration"] == chunked.info["duration"]
+        assert (
+            np.asarray(whole.convert("RGB")) == np.asarray(chunked.convert("RGB"))
+        ).all()
+
+
+def test_unknown_format(tmp_path):
+    """only gif and mp4 can be exported to."""
+    from stuntcat import export
+
+    with pytest.raises(ValueError):
+        export.export(str(tmp_path / "session.rec"), str(tmp_path / "out.avi"))
@@ -1,18 +1,5 @@
 import pytest
 
-@pytest.fixture(scope='session')
-def pg():
-    """ This initialises pygame and quits it once per session.
-
-    Also returns pygame so it can be used as a fixture.
-    """
-    import pygame
-    # setup.
-    pygame.init()
-    yield pygame
-    # teardown
-    pygame.quit()
-
 
 def test_first(pg):
     surf = pg.Surface((1, 1), pg.SRCALPHA, 32)
@@ -23,3 +10,11 @@ def test_first(pg):
 def test_game(pg):
     from stuntcat.game import Game
     Game()
+
+
+def test_game_headless(pg):
+    from stuntcat.game import Game
+    game = Game(headless=True, render=False)
+    assert game.cat_scene is not None
+    assert game.simulate(10) > 0
+    assert game.cat_scene.total_time == pytest.approx(10 * 1000.0 / Game.FPS)
@@ -0,0 +1,116 @@
+import pytest
+
+
+@pytest.fixture
+def scene(pg):
+    from stuntcat.game import Game
+
+    game = Game(headless=True, render=False)
+    scene = game.cat_scene
+    scene._spawn_flying_objects = lambda: None
+    for fish in scene.fish.sprites():
+        fish.kill()
+    return scene
+
+
+def test_trajectory(scene):
+    """ Flying objects are moved once per tick, and never by update."""
+    from stuntcat.scenes.unisharklazer.flying_objects import Fish
+
+    fish = Fish(scene.allsprites, (100, 200), (6, -10))
+    scene.fish.append(fish)
+    start = list(fish.pos)
+
+    trajectory = []
+    for _ in range(5):
+        scene.tick(17)  # dt_scaled of 1
+        scene.update_sprites()
+        scene.update_sprites()
+        trajectory.append((round(fish.pos[0], 6), round(fish.pos[1], 6)))
+
+    assert start == [100, 200]
+    assert trajectory == [
+        (107.5, 187.8125),
+        (115.0, 175.9375),
+        (122.5, 164.375),
+        (130.0, 153.125),
+        (137.5, 142.1875),
+    ]
+    assert fish.velocity[1] == pytest.approx(-10 + 5 * 0.2 * 1.25)
+    assert fish.rect.topleft == (113, 117)
+
+
+def test_eaten_once(scene):
+    """ A fish at the cat's head scores exactly once."""
+    from stuntcat.scenes.unisharklazer.flying_objects import Fish
+
+    head_x, head_y = scene.player_data.cat_head_location
+    fish = Fish(scene.allsprites, (0, 0), (0, 0))
+    fish.pos = [head_x + 25, head_y + 25]
+    scene.fish.append(fish)
+
+    scene.tick(17)
+    scene.update_sprites()
+    assert scene.player_data.score == 1
+    assert not fish.alive()
+    assert len(scene.fish) == 0
+
+
+def _rings(count):
+    from stuntcat.scenes.unisharklazer.flying_objects import NotFish
+
+    return [NotFish((), (i, 10 * i), (i, -i)) for i in range(count)]
+
+
+def test_kill_middle_row(scene):  # pylint:disable=unused-argument
+    """ The last row moves into a killed sprite's row, and its views follow."""
+    from stuntcat.scenes.unisharklazer.flying_objects import FlyingObjectGroup
+
+    group = FlyingObjectGroup()
+    first, middle, last = rings = _rings(3)
+    group.extend(rings)
+
+    middle.kill()
+    assert list(middle.pos) == [1, 10]
+    assert middle.arrays_group is None
+    assert last.arrays_row == 1
+    assert group.positions.tolist() == [[0, 0], [2, 20]]
+    assert group.velocities.tolist() == [[0, 0], [2, -2]]
+
+    group.positions[1] = (5, 6)
+    assert list(last.pos) == [5, 6]
+    last.velocity[0] = 7
+    assert group.velocities[1].tolist() == [7, -2]
+    assert list(first.pos) == [0, 0]
+
+
+def test_grows_past_capacity(scene):  # pylint:disable=unused-argument
+    """ Adding more sprites than the arrays hold keeps every row."""
+    from stuntcat.scenes.unisharklazer.flying_objects import FlyingObjectGroup
+
+    group = FlyingObjectGroup()
+    rings = _rings(len(group._positions) * 2 + 1)  # pylint:disable=protected-access
+    group.extend(rings)
+    assert group.positions.tolist() == [[i, 10 * i] for i in range(len(rings))]
+    assert group.velocities.tolist() == [[i, -i] for i in range(len(rings))]
+    for ring in rings:
+        ring.pos[0] += 1
+    assert group.positions[:, 0].tolist() == [i + 1 for i in range(len(rings))]
+
+
+def test_readd_after_all_killed(scene):  # pylint:disable=unused-argument
+    """ Sprites can go back in a group once every one was killed."""
+    from stuntcat.scenes.unisharklazer.flying_objects import FlyingObjectGroup
+
+    group = FlyingObjectGroup()
+    rings = _rings(3)
+    group.extend(rings)
+    for ring in rings:
+        ring.kill()
+    assert len(group) == 0 and len(group.positions) == 0
+
+    group.extend(rings[::-1])
+    assert [ring.arrays_row for ring in rings] == [2, 1, 0]
+    assert group.positions.tolist() == [[2, 20], [1, 10], [0, 0]]
+    group.integrate(1, 1000)
+    assert [list(ring.pos) for ring in rings] == [[0, 0.2], [2, 9.2], [4, 18.2]]
@@ -0,0 +1,29 @@
+"""Tests for the frame time ring buffers."""
+import pytest
+
+from stuntcat.frametimes import FrameTimes
+
+
+def test_ring_buffer_percentiles():
+    """only the last size durations count towards the percentiles."""
+    times = FrameTimes(size=100)
+    for _ in range(50):
+        times.record("tick", 1.0)
+    for i in range(100):
+        times.record("tick", i / 1000.0)
+    assert len(times.durations("tick")) == 100
+    p50, p95, p99 = times.summary()["tick"]
+    assert p50 == pytest.approx(0.0495)
+    assert p95 < p99 < 0.1
+    assert "tick" in times.report()
+
+
+def test_game_records_per_scene(pg):  # pylint:disable=unused-argument
+    """a headless game times every part of the frame, per scene."""
+    from stuntcat.game import Game
+
+    game = Game(headless=True)
+    game.simulate(10)
+    summary = game.frame_times.summary()
+    for name in ("tick", "tick CatUniScene", "render CatUniScene", "events", "display update"):
+        assert name in summary
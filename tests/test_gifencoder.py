@@ -0,0 +1,38 @@
+"""Tests for the numpy gif encoder."""
+import numpy as np
+from PIL import Image
+
+from stuntcat.gifencoder import GifEncoder, PALETTE, quantize, changed_rect
+
+
+def test_frames_decode_to_quantized(tmp_path):
+    """Pillow decodes every frame, delta rects and all, to the palette colors."""
+    rng = np.random.default_rng(0)
+    background = rng.integers(0, 256, (30, 40, 3), dtype=np.uint8)
+    frames = []
+    for i in range(4):
+        frame = background.copy()
+        frame[5:15, i * 5 : i * 5 + 10] = (255, 0, 0)
+        frames.append(frame)
+    frames.append(frames[-1].copy())
+
+    path = str(tmp_path / "anim.gif")
+    with GifEncoder(path, (40, 30), fps=30) as encoder:
+        for frame in frames:
+            encoder.add_frame(frame.tobytes())
+
+    gif = Image.open(path)
+    assert gif.n_frames == len(frames)
+    for i, frame in enumerate(frames):
+        gif.seek(i)
+        decoded = np.asarray(gif.convert("RGB"))
+        assert (decoded == PALETTE[quantize(frame)]).all()
+
+
+def test_changed_rect():
+    """the rect covers just the differing pixels."""
+    previous = np.zeros((10, 20), np.uint8)
+    current = previous.copy()
+    assert changed_rect(previous, current) is None
+    current[2, 3] = current[5, 7] = 1
+    assert changed_rect(previous, current) == (3, 2, 5, 4)
@@ -0,0 +1,167 @@
+"""Tests for the gif maker."""
+import os
+import stat
+import threading
+import time
+
+import pygame
+import pytest
+
+from stuntcat import gifmaker
+
+K_G = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_g)
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """ A stand in ffmpeg, which writes what it gets on stdin to the output.
+
+    gifmaker finds it instead of any real ffmpeg. Returns its path, so
+    tests can write a different script to it.
+    """
+    path = tmp_path / "ffmpeg"
+    path.write_text('#!/bin/sh\nfor last; do :; done\ncat > "$last"\n')
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(gifmaker, "which", {"ffmpeg": str(path)}.get)
+    return path
+
+
+def _record(maker, screen, frames):
+    """press g, draw frames, press g again."""
+    maker.update([K_G], screen)
+    for i in range(frames):
+        screen.fill((i % 25 * 10, 0, 0))
+        maker.update([], screen)
+    maker.update([K_G], screen)
+
+
+def test_frames_streamed_to_ffmpeg(pg, tmp_path, fake_ffmpeg):  # pylint:disable=unused-argument
+    """frames are piped as raw rgb from a worker, which posts GIF_SAVED."""
+    screen = pygame.Surface((8, 6))
+    maker = gifmaker.GifMaker(path=str(tmp_path))
+    pygame.event.clear(gifmaker.GIF_SAVED)
+    _record(maker, screen, 5)
+    maker.wait()
+
+    # The frame g is pressed on is recorded too.
+    assert os.path.getsize(str(tmp_path / "anim.gif")) == 6 * 8 * 6 * 3
+    assert sorted(os.listdir(str(tmp_path))) == ["anim.gif", "ffmpeg"]
+    saved = pygame.event.get(gifmaker.GIF_SAVED)
+    assert [(event.path, event.error) for event in saved] == [
+        (maker._output_path(), None)  # pylint:disable=protected-access
+    ]
+
+
+def test_wait_while_recording(pg, tmp_path, fake_ffmpeg):  # pylint:disable=unused-argument
+    """waiting, like the game does when quit, ends the recording first."""
+    screen = pygame.Surface((8, 6))
+    maker = gifmaker.GifMaker(path=str(tmp_path))
+    maker.update([K_G], screen)
+    maker.update([], screen)
+    maker.wait()
+    assert os.path.getsize(str(tmp_path / "anim.gif")) == 2 * 8 * 6 * 3
+
+
+def test_ffmpeg_quitting_early(pg, tmp_path, fake_ffmpeg):
+    """if ffmpeg dies, capturing still never blocks and the error is posted."""
+    fake_ffmpeg.write_text("#!/bin/sh\nexit 1\n")
+    screen = pygame.Surface((8, 6))
+    maker = gifmaker.GifMaker(path=str(tmp_path))
+    pygame.event.clear(gifmaker.GIF_SAVED)
+    # More frames than fit in the queue.
+    _record(maker, screen, maker.QUEUE_FRAMES * 3)
+    maker.wait()
+    saved = pg.event.get(gifmaker.GIF_SAVED)
+    assert len(saved) == 1 and "ffmpeg could not make" in saved[0].error
+
+
+def test_replay_ring_keeps_last_frames(pg):  # pylint:disable=unused-argument
+    """the ring keeps the newest frames, oldest first, in fixed memory."""
+    screen = pygame.Surface((4, 3), depth=32)
+    ring = gifmaker.ReplayRing(screen.get_size(), 3)
+    buffer = ring.buffer
+    for i in range(5):
+        screen.fill((i, 0, 0))
+        ring.capture(screen)
+    assert ring.buffer is buffer
+    assert [frame[0, 0, 0] for frame in ring.frames()] == [2, 3, 4]
+
+    frames = list(gifmaker._rgb_frames(ring.frames()))  # pylint:disable=protected-access
+    assert frames[-1] == pygame.image.tobytes(screen, "RGB")
+
+
+def test_instant_replay_saved(pg, tmp_path, fake_ffmpeg):  # pylint:disable=unused-argument
+    """K_r saves the frames in the ring."""
+    screen = pygame.Surface((8, 6), depth=32)
+    maker = gifmaker.GifMaker(path=str(tmp_path), fps=10, replay_seconds=0.5)
+    for _ in range(7):
+        maker.update([], screen)
+    maker.update([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)], screen)
+    maker.wait()
+    assert os.path.getsize(str(tmp_path / "replay.gif")) == 5 * 8 * 6 * 3
+
+
+def test_instant_replay_while_recording(pg, tmp_path, fake_ffmpeg):  # pylint:disable=unused-argument
+    """K_r while recording saves the replay after the recording ends."""
+    screen = pygame.Surface((8, 6), depth=32)
+    maker = gifmaker.GifMaker(path=str(tmp_path), fps=10, replay_seconds=0.5)
+    pygame.event.clear(gifmaker.GIF_SAVED)
+    maker.update([K_G], screen)
+    maker.update([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)], screen)
+    for _ in range(3):
+        maker.update([], screen)
+    maker.update([K_G], screen)
+    maker.wait()
+    # The ring held one frame when K_r was pressed.
+    assert os.path.getsize(str(tmp_path / "replay.gif")) == 1 * 8 * 6 * 3
+    assert os.path.getsize(str(tmp_path / "anim.gif")) == 5 * 8 * 6 * 3
+    saved = pygame.event.get(gifmaker.GIF_SAVED)
+    assert [event.path for event in saved] == [
+        maker._output_path(),  # pylint:disable=protected-access
+        maker._replay_path(),  # pylint:disable=protected-access
+    ]
+    # Once the replay's frames are read, the ring captures again.
+    count = maker.replay.count
+    maker.update([], screen)
+    assert maker.replay.count == count + 1
+
+
+def test_encoder_raising(pg, tmp_path, monkeypatch):
+    """if the numpy encoder raises, capturing still never blocks and the error is posted."""
+
+    def add_frame(self, frame):
+        raise ValueError("frame is the wrong size")
+
+    monkeypatch.setattr(gifmaker, "which", lambda cmd: None)
+    monkeypatch.setattr(gifmaker.GifEncoder, "add_frame", add_frame)
+    screen = pygame.Surface((8, 6))
+    maker = gifmaker.GifMaker(path=str(tmp_path))
+    pygame.event.clear(gifmaker.GIF_SAVED)
+    # More frames than fit in the queue.
+    _record(maker, screen, maker.QUEUE_FRAMES * 3)
+    maker.wait()
+    saved = pg.event.get(gifmaker.GIF_SAVED)
+    assert len(saved) == 1 and "frame is the wrong size" in saved[0].error
+
+
+def test_capture_while_last_gif_saving(pg, tmp_path, fake_ffmpeg):  # pylint:disable=unused-argument
+    """a new gif takes frames at once, even while the last one is still saving."""
+    screen = pygame.Surface((8, 6))
+    maker = gifmaker.GifMaker(path=str(tmp_path))
+    slow = threading.Event()
+    maker.worker = threading.Thread(target=slow.wait, args=(5,))
+    maker.worker.start()
+
+    start = time.perf_counter()
+    _record(maker, screen, maker.QUEUE_FRAMES * 3)
+    assert time.perf_counter() - start < 2
+    # Saved only after the gif before it.
+    time.sleep(0.1)
+    assert not os.path.exists(str(tmp_path / "anim.gif"))
+
+    slow.set()
+    maker.wait()
+    assert os.path.getsize(str(tmp_path / "anim.gif")) == (
+        (maker.QUEUE_FRAMES * 3 + 1) * 8 * 6 * 3
+    )
+    assert sorted(os.listdir(str(tmp_path))) == ["anim.gif", "ffmpeg"]
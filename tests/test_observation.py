@@ -0,0 +1,71 @@
+import pytest
+
+
+@pytest.fixture
+def scene(pg):  # pylint:disable=unused-argument
+    """ A cat scene in a headless game.
+    """
+    pytest.importorskip("numpy")
+    from stuntcat.game import Game
+
+    return Game(headless=True, render=False).cat_scene
+
+
+def test_observe_shapes(scene):
+    """grayscale has one channel and rgb three, all uint8."""
+    import numpy as np
+    from stuntcat.observation import PixelObserver
+
+    for grayscale, shape in ((True, (4, 27, 48)), (False, (4, 27, 48, 3))):
+        observer = PixelObserver(scene, size=(48, 27), grayscale=grayscale, stack=4)
+        frames = observer.observe()
+        assert frames.shape == shape
+        assert frames.dtype == np.uint8
+        observer.close()
+
+
+def test_observe_stack_order(scene):
+    """the stack has the oldest frame first and the newest last."""
+    from stuntcat.observation import PixelObserver
+
+    observer = PixelObserver(scene, size=(8, 6), grayscale=False, stack=3, smooth=False)
+    for i in range(1, 6):
+        observer.canvas.fill((i * 10, 0, 0))
+        frames = observer.observe(render=False)
+        expected = [max(0, j) * 10 for j in range(i - 2, i + 1)]
+        assert frames[:, 0, 0, 0].tolist() == expected
+
+    observer.reset()
+    assert not observer.observe(render=False)[:-1].any()
+
+
+def test_observe_grayscale(scene):
+    """grayscale frames are the luma of the rgb ones."""
+    from stuntcat.observation import PixelObserver
+
+    observer = PixelObserver(scene, size=(8, 6), stack=2, smooth=False)
+    observer.canvas.fill((100, 100, 100))
+    frames = observer.observe(render=False)
+    assert abs(int(frames[-1, 0, 0]) - 100) <= 1
+
+
+def test_observe_reuses_buffer(scene):
+    """every observation is a view of the same preallocated frames."""
+    from stuntcat.observation import PixelObserver
+
+    observer = PixelObserver(scene, size=(8, 6), stack=2)
+    buffer = observer._frames  # pylint:disable=protected-access
+    for _ in range(3):
+        assert observer.observe().base is buffer
+
+
+def test_observer_redirects_screen(scene):
+    """the scene draws into the canvas until the observer is closed."""
+    from stuntcat.observation import PixelObserver
+
+    screen = scene.screen
+    observer = PixelObserver(scene, size=(8, 6))
+    assert scene.screen is observer.canvas
+    observer.observe()
+    observer.close()
+    assert scene.screen is screen
@@ -0,0 +1,33 @@
+"""Tests for the decoded sound cache."""
+import os
+
+from stuntcat import pcmcache
+from stuntcat.resources import data_path
+
+
+def test_sound_cached_decoded(pg, tmp_path, monkeypatch):
+    """the second load comes from the cache, with the same samples."""
+    monkeypatch.setenv("STUNTCAT_CACHE_DIR", str(tmp_path))
+    path = os.path.join(data_path(), "sounds", "boing1.ogg")
+
+    decoded = pcmcache.load(path)
+    pcm_path = pcmcache.cache_path(path, pg.mixer.get_init())
+    assert os.path.dirname(pcm_path) == str(tmp_path)
+    assert os.path.getsize(pcm_path) == len(decoded.get_raw())
+
+    cached = pcmcache.load(path)
+    assert cached.get_raw() == decoded.get_raw()
+
+
+def test_failed_write_cleaned_up(pg, tmp_path, monkeypatch):
+    """if saving the samples fails, the sound still loads and no file is left."""
+    monkeypatch.setenv("STUNTCAT_CACHE_DIR", str(tmp_path))
+    path = os.path.join(data_path(), "sounds", "boing2.ogg")
+
+    def replace(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(pcmcache.os, "replace", replace)
+    sound = pcmcache.load(path)
+    assert sound.get_length() > 0
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,62 @@
+"""Tests for the platformer's fixed physics step and dirty rect rendering."""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def make_scene(pg, monkeypatch):
+    """ Make PlatformerScenes, in the data dir they load their map from.
+    """
+    from stuntcat.game import Game
+    from stuntcat.resources import data_path
+    from stuntcat.scenes import PlatformerScene
+
+    game = Game(headless=True, render=False)
+    monkeypatch.chdir(os.path.dirname(data_path()))
+    return lambda **kwargs: PlatformerScene(game, **kwargs)
+
+
+def _play(scene, fps, seconds):
+    scene.player.accelerate(1)
+    for _ in range(int(fps * seconds)):
+        scene.tick(1000.0 / fps)
+    return tuple(scene.player.position)
+
+
+def test_same_at_any_frame_rate(make_scene):
+    """the physics steps the same however the time is split into frames."""
+    at_30 = _play(make_scene(), 30, 2)
+    assert _play(make_scene(), 60, 2) == at_30
+    assert _play(make_scene(), 20, 2) == at_30
+
+
+def test_catch_up_is_limited(make_scene):
+    """a long frame does at most max_steps, and the rest is dropped."""
+    scene = make_scene(step=0.01, max_steps=5)
+    scene.tick(10000)
+    assert scene.accumulator == 0.0
+    scene.tick(25)
+    assert scene.accumulator == pytest.approx(0.005)
+
+
+def test_render_only_changed_areas(make_scene):
+    """the first frame is all drawn, then only where a sprite moved from and to."""
+    scene = make_scene()
+    screen_rect = scene._game.screen.get_rect()  # pylint:disable=protected-access
+    scene.sprites.update(alpha=1.0)
+    assert scene.render() == [screen_rect]
+
+    scene.sprites.update(alpha=1.0)
+    assert scene.render() == []
+
+    moved = next(
+        asprite for asprite in scene.sprites if screen_rect.colliderect(asprite.rect)
+    )
+    old_rect = moved.rect.clip(screen_rect)
+    moved.shape.body.position = screen_rect.center
+    moved.shape.cache_bb()
+    scene.sprites.update(alpha=1.0)
+    new_rect = moved.rect.clip(screen_rect)
+    assert not old_rect.colliderect(new_rect)
+    assert sorted(scene.render()) == sorted([old_rect, new_rect])
@@ -0,0 +1,52 @@
+def _state(game):
+    scene = game.cat_scene
+    player_data = scene.player_data
+    return (
+        player_data.score,
+        tuple(player_data.cat_location),
+        tuple(player_data.cat_speed),
+        player_data.cat_angle,
+        player_data.cat_angular_vel,
+        scene.total_time,
+        scene.deaths,
+        [tuple(fish.pos) for fish in scene.fish],
+        [tuple(fish.pos) for fish in scene.not_fish],
+    )
+
+
+def test_replay_is_exact(pg, tmp_path, play_session):
+    from stuntcat.game import Game
+    from stuntcat.replay import Recorder, Replayer
+
+    path = str(tmp_path / "session.rec")
+    pg.event.clear()
+    game = Game(headless=True, render=False, recorder=Recorder(path, seed=1234))
+    play_session(game, 900)
+    game.recorder.close()
+    recorded = _state(game)
+
+    replayed = Replayer(path).run()
+    assert _state(replayed) == recorded
+    assert sum(1 for _ in Replayer(path).frames()) == 900
+
+
+def test_replay_from_loading_screen(pg, tmp_path, play_session):
+    """ Keys pressed in the frame the loading screen ends in don't reach the cat scene."""
+    from stuntcat.game import Game
+    from stuntcat.replay import Recorder, Replayer
+
+    path = str(tmp_path / "session.rec")
+    pg.event.clear()
+    game = Game(render=False, recorder=Recorder(path, seed=99))
+    game.step(0)
+    pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_RETURN))
+    pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_RIGHT))
+    game.step(1000.0 / 30)
+    assert game.cat_scene is None
+    play_session(game, 40)
+    game.recorder.close()
+    recorded = _state(game)
+
+    replayed = Replayer(path).run()
+    assert _state(replayed) == recorded
+    assert sum(1 for _ in Replayer(path).frames()) == 40
@@ -0,0 +1,92 @@
+"""Tests for the resources module."""
+import pygame
+
+from stuntcat.resources import RotationCache
+
+
+def test_rotation_cache_buckets_and_bound():
+    """angles share a rotation within a bucket, and old ones are dropped."""
+    image = pygame.Surface((20, 10), depth=32)
+    # Room for two rotations of 20x10 to a multiple of 90 degrees.
+    cache = RotationCache(max_bytes=2 * 20 * 10 * 4)
+    first = cache.get(image, 90.2)
+    assert cache.get(image, 89.8) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(image, 180)
+    cache.get(image, 270)
+    assert len(cache) == 2
+    assert cache.stats()["resident_bytes"] <= 2 * 20 * 10 * 4
+    assert cache.get(image, 90) is not first
+
+
+def test_rotation_cache_wraps_turns():
+    """spinning round again hits the rotations of the first turn."""
+    image = pygame.Surface((8, 8))
+    cache = RotationCache()
+    for angle in range(-720, 720, 15):
+        cache.get(image, angle + 0.2)
+    assert len(cache) == 360 // 15
+    assert cache.misses == 360 // 15
+    assert cache.get(image, 359.8) is cache.get(image, 0)
+
+
+def test_shape_sprites_share_rotations(pg):  # pylint:disable=unused-argument
+    """two balls at the same angle get the same rotated surface."""
+    from stuntcat.scenes.platformer import sprite
+
+    balls = [sprite.Ball(pygame.Rect(0, 0, 32, 32)) for _ in range(2)]
+    for ball in balls:
+        ball.shape.body.angle = 1.0
+        ball.update()
+    assert balls[0].image is balls[1].image
+
+
+def test_preloader_fills_caches(pg):  # pylint:disable=unused-argument
+    """after preloading, gfx and sfx return what the worker loaded."""
+    from stuntcat import resources
+
+    preloader = resources.Preloader([("ring.png", False, True)], ["boing1.ogg"])
+    assert preloader.progress == 0
+    preloader.start()
+    preloader.join()
+    assert preloader.finished and preloader.error is None
+    assert preloader.progress == 1.0
+    assert ("ring.png", False, True) in resources._GFX_CACHE  # pylint:disable=protected-access
+    assert "boing1.ogg" in resources._SFX_CACHE  # pylint:disable=protected-access
+
+
+def test_resource_cache_budget():
+    """least recently used values go past the budget, pinned ones stay."""
+    from stuntcat.resources import ResourceCache
+
+    cache = ResourceCache(max_bytes=30, sizeof=len)
+    cache.pin("a")
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    cache.put("c", b"x" * 10)
+    assert cache.get("b") is not None
+    cache.put("d", b"x" * 10)
+
+    assert "a" in cache and "b" in cache and "d" in cache
+    assert "c" not in cache
+    assert cache.get("c") is None
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "items": 3,
+        "resident_bytes": 30,
+        "max_bytes": 30,
+    }
+
+
+def test_cats_share_frames(pg):  # pylint:disable=unused-argument
+    """every Cat has the same frame surfaces, so they share rotations."""
+    from stuntcat.game import Game
+    from stuntcat.scenes.unisharklazer.cat import Cat
+
+    scene = Game(headless=True, render=False).cat_scene
+    cats = [Cat(scene) for _ in range(2)]
+    assert cats[0].images == cats[1].images
+    assert all(a is b for a, b in zip(cats[0].flipped_images, cats[1].flipped_images))
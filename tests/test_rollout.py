@@ -0,0 +1,9 @@
+def test_rollout_farm():
+    from stuntcat.rollout import RolloutFarm
+
+    with RolloutFarm(num_workers=2, num_envs=3, length=16) as farm:
+        assert farm.run(steps=20) > 0
+        assert list(farm.buffer.heads) == [20, 20]
+        observations, actions, rewards, dones = farm.buffer.latest(1)
+        assert observations.shape == (3, farm.buffer.observations.shape[-1])
+        assert observations.any()
@@ -0,0 +1,26 @@
+"""Tests for the lazy scene registry."""
+import subprocess
+import sys
+
+import pytest
+
+from stuntcat import scenes
+from stuntcat.scenes.news import NewsScene
+
+
+def test_game_import_skips_unused_scenes():
+    """importing the game doesn't import the platformer, pymunk or the gif maker."""
+    code = (
+        "import sys, stuntcat.game; "
+        "print(sorted(m for m in ('pymunk', 'pytmx', 'stuntcat.gifmaker') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test_scenes_load_on_use():
+    """scenes import when first used, unknown names still fail."""
+    assert scenes.NewsScene is NewsScene
+    assert "PlatformerScene" in dir(scenes)
+    with pytest.raises(AttributeError):
+        scenes.NoSuchScene  # pylint:disable=pointless-statement
@@ -0,0 +1,46 @@
+import pickle
+import random
+
+
+def _play(pg, scene, frames, start):
+    keys = [pg.K_RIGHT, pg.K_a, pg.K_UP, pg.K_LEFT, pg.K_d]
+    for frame in range(start, start + frames):
+        if frame % 9 == 0:
+            key = keys[frame // 9 % len(keys)]
+            event_type = pg.KEYDOWN if frame % 18 == 0 else pg.KEYUP
+            scene.event(pg.event.Event(event_type, key=key))
+        scene.tick(1000.0 / 30)
+
+
+def _state(scene):
+    player_data = scene.player_data
+    return (
+        player_data.snapshot(),
+        scene.total_time,
+        scene.deaths,
+        scene.shark.snapshot(),
+        [(fish.kind, tuple(fish.pos)) for fish in scene.fish],
+        [tuple(fish.pos) for fish in scene.not_fish],
+        random.random(),
+    )
+
+
+def test_restore_replays_the_same(pg):
+    from stuntcat.game import Game
+
+    random.seed(42)
+    game = Game(headless=True, render=False)
+    scene = game.cat_scene
+    # get the rings and the shark going.
+    for timing in scene.shark.timings:
+        scene.shark.timings[timing] = 150
+    scene.player_data._score = 60
+    _play(pg, scene, 20, 0)
+
+    snapshot = scene.snapshot()
+    _play(pg, scene, 400, 20)
+    expected = _state(scene)
+
+    scene.restore(pickle.loads(pickle.dumps(snapshot)))
+    _play(pg, scene, 400, 20)
+    assert _state(scene) == expected
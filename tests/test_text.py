@@ -0,0 +1,65 @@
+"""Tests for the glyph atlas text."""
+import pygame
+
+from stuntcat import text
+
+
+def test_atlas_renders_like_font(pg):  # pylint:disable=unused-argument
+    """strings are the font's size, glyphs are rendered once, strings cached."""
+    afont = text.font("monospace", 30, bold=True)
+    assert text.font("monospace", 30, bold=True) is afont
+    assert text.atlas("monospace", 30, (0, 0, 0)) is text.atlas("monospace", 30, [0, 0, 0])
+    atlas = text.GlyphAtlas(afont, (0, 0, 0))
+
+    image = atlas.render("1010")
+    assert image.get_size() == afont.size("1010")
+    assert atlas.render("1010") is image
+    assert len(atlas._glyphs) == 2  # pylint:disable=protected-access
+
+    single = pygame.surfarray.array_alpha(atlas.render("0"))
+    expected = pygame.surfarray.array_alpha(afont.render("0", True, (0, 0, 0)))
+    assert (single == expected).all()
+
+
+class _CountingFont:
+    """A font that counts the size calls made of it."""
+
+    def __init__(self, afont):
+        self.afont = afont
+        self.size_calls = 0
+
+    def size(self, string):
+        self.size_calls += 1
+        return self.afont.size(string)
+
+    def render(self, *args):
+        return self.afont.render(*args)
+
+    def get_height(self):
+        return self.afont.get_height()
+
+
+def test_glyphs_placed_like_font(pg):  # pylint:disable=unused-argument
+    """each glyph of a score is at the width of the text before it."""
+    afont = text.font("monospace", 30, bold=True)
+    string = "90817"
+    atlas = text.GlyphAtlas(afont, (0, 0, 0))
+    image = pygame.surfarray.array_alpha(atlas.render(string))
+
+    expected = pygame.Surface(afont.size(string), pygame.SRCALPHA)
+    for i, char in enumerate(string):
+        expected.blit(
+            afont.render(char, True, (0, 0, 0)),
+            (afont.size(string[:i])[0], 0),
+            special_flags=pygame.BLEND_RGBA_MAX,
+        )
+    assert (image == pygame.surfarray.array_alpha(expected)).all()
+
+
+def test_long_strings_measured_once(pg):  # pylint:disable=unused-argument
+    """font.size is called once a string and twice a new pair of glyphs."""
+    counting = _CountingFont(text.font("monospace", 30, bold=True))
+    atlas = text.GlyphAtlas(counting, (0, 0, 0))
+    atlas.render("9081726354" * 20)
+    # "" before 9, the 9 pairs in the digits and 4 before 9 again.
+    assert counting.size_calls == 1 + 2 * 11